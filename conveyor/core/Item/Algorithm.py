@@ -0,0 +1,48 @@
+import re
+import typing
+import hashlib
+import functools
+import dataclasses
+
+from .Digest import Digest
+
+Buffer = bytes | memoryview
+
+
+@dataclasses.dataclass(frozen=True, kw_only=False)
+class Algorithm:
+    name: str
+    function: typing.Callable[[Buffer], bytes] = dataclasses.field(compare=False)
+
+    registry: typing.ClassVar[dict[str, "Algorithm"]] = {}
+
+    regex = re.compile(r"\w+")
+
+    def __post_init__(self):
+        if not self.regex.fullmatch(self.name):
+            raise TypeError(f"`Algorithm` name must match regex {self.regex}")
+        Algorithm.registry[self.name] = self
+
+    @classmethod
+    def named(cls, name: str) -> "Algorithm":
+        try:
+            return cls.registry[name]
+        except KeyError as e:
+            raise KeyError(f"Unknown digest algorithm `{name}`") from e
+
+    def __reduce__(self):
+        return (Algorithm.named, (self.name,))
+
+    def __call__(self, input_: Buffer) -> bytes:
+        return self.function(input_)
+
+    def digest(self, input_: Buffer) -> Digest:
+        return Digest(self(input_), self.name)
+
+    @functools.cached_property
+    def empty(self) -> Digest:
+        return self.digest(b"")
+
+
+sha3_512 = Algorithm("sha3_512", lambda i: hashlib.sha3_512(i).digest())
+blake2b = Algorithm("blake2b", lambda i: hashlib.blake2b(i).digest())
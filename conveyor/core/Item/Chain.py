@@ -3,7 +3,7 @@ import dataclasses
 from .Data import Data
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class Chain:
     ref: Data | str
     test: str | None = None
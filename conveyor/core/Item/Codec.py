@@ -0,0 +1,286 @@
+import io
+import struct
+import typing
+import datetime
+import dataclasses
+
+from .Item import Item
+from .Data import Lazy
+from .Digest import Digest
+from .Algorithm import Algorithm
+from .Enumerable import Enumerable
+
+
+class Tag:
+    none = 0
+    str_ = 1
+    int_ = 2
+    float_ = 3
+    datetime = 4
+    enumerable = 5
+    enumerable_none = 6
+    big_int = 7
+
+
+class Flag:
+    inline = 1
+    reserved = 2
+
+
+epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+int_range = range(-(2**63), 2**63)
+microsecond = datetime.timedelta(microseconds=1)
+
+
+@dataclasses.dataclass(frozen=True, kw_only=False)
+class Writer:
+    stream: typing.BinaryIO
+
+    def pack(self, format_: str, *values: typing.Any) -> None:
+        self.stream.write(struct.pack(format_, *values))
+
+    def bytes_(self, value: Item.Data.Buffer) -> None:
+        self.pack("<Q", memoryview(value).nbytes)
+        self.stream.write(value)
+
+    def str_(self, value: str) -> None:
+        self.bytes_(value.encode())
+
+    def timestamp(self, value: datetime.datetime) -> None:
+        if value.tzinfo is None:
+            self.pack("<Bq", 0, (value - epoch.replace(tzinfo=None)) // microsecond)
+        else:
+            self.pack("<Bq", 1, (value - epoch) // microsecond)
+
+    def none(self, _: None) -> None:
+        self.pack("<B", Tag.none)
+
+    def tagged_str(self, value: str) -> None:
+        self.pack("<B", Tag.str_)
+        self.str_(value)
+
+    def int_(self, value: int) -> None:
+        if value in int_range:
+            self.pack("<Bq", Tag.int_, value)
+        else:
+            self.pack("<B", Tag.big_int)
+            self.bytes_(
+                value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True)
+            )
+
+    def float_(self, value: float) -> None:
+        self.pack("<Bd", Tag.float_, value)
+
+    def tagged_timestamp(self, value: datetime.datetime) -> None:
+        self.pack("<B", Tag.datetime)
+        self.timestamp(value)
+
+    def enumerable(self, value: Enumerable) -> None:
+        if value.value is None:
+            self.pack("<B", Tag.enumerable_none)
+        else:
+            self.pack("<B", Tag.enumerable)
+            self.str_(value.value)
+
+    @property
+    def writers(self) -> tuple[tuple[type, typing.Callable[[typing.Any], None]], ...]:
+        return (
+            (type(None), self.none),
+            (str, self.tagged_str),
+            (int, self.int_),
+            (float, self.float_),
+            (datetime.datetime, self.tagged_timestamp),
+            (Enumerable, self.enumerable),
+        )
+
+    def value(self, value: Item.Metadata.Value) -> None:
+        for type_, write in self.writers:
+            if isinstance(value, type_):
+                return write(value)
+        raise TypeError(
+            f"Can not encode metadata value `{value}` of type `{type(value)}`"
+        )
+
+    def data(self, data: Item.Data, *, inline: bool) -> None:
+        self.str_(data.algorithm.name)
+        self.bytes_(data.value if inline else data.digest.value)
+
+
+@dataclasses.dataclass(kw_only=False)
+class Reader:
+    source: memoryview
+    position: int = 0
+
+    def unpack(self, format_: str) -> tuple[typing.Any, ...]:
+        try:
+            result = struct.unpack_from(format_, self.source, self.position)
+        except struct.error as e:
+            raise ValueError("Unexpected end of encoded item") from e
+        self.position += struct.calcsize(format_)
+        return result
+
+    def bytes_(self) -> bytes:
+        (length,) = self.unpack("<Q")
+        if self.position + length > len(self.source):
+            raise ValueError("Unexpected end of encoded item")
+        result = bytes(self.source[self.position : self.position + length])
+        self.position += length
+        return result
+
+    def str_(self) -> str:
+        return self.bytes_().decode()
+
+    def timestamp(self) -> datetime.datetime:
+        aware, microseconds = self.unpack("<Bq")
+        result = epoch + microseconds * microsecond
+        return result if aware else result.replace(tzinfo=None)
+
+    def value(self) -> Item.Metadata.Value:
+        (tag,) = self.unpack("<B")
+        try:
+            read = {
+                Tag.none: lambda: None,
+                Tag.str_: self.str_,
+                Tag.int_: lambda: self.unpack("<q")[0],
+                Tag.float_: lambda: self.unpack("<d")[0],
+                Tag.datetime: self.timestamp,
+                Tag.enumerable: lambda: Enumerable(self.str_()),
+                Tag.enumerable_none: lambda: Enumerable(None),
+                Tag.big_int: lambda: int.from_bytes(
+                    self.bytes_(), "little", signed=True
+                ),
+            }[tag]
+        except KeyError as e:
+            raise ValueError(f"Unknown metadata value tag {tag}") from e
+        return read()
+
+
+def unresolvable(digest: Digest) -> Item.Data:
+    raise KeyError(f"Data for digest {digest.string} is not available")
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Codec:
+    Writer = Writer
+    Reader = Reader
+
+    magic = b"CNV"
+    version = 1
+
+    inline: bool = True
+    resolve: typing.Callable[[Digest], Item.Data] = unresolvable
+
+    def _header(self, writer: Writer) -> None:
+        writer.stream.write(self.magic)
+        writer.pack("<B", self.version)
+
+    def _check_header(self, reader: Reader) -> None:
+        if (magic := bytes(reader.source[: len(self.magic)])) != self.magic:
+            raise ValueError(f"Unexpected magic {magic!r} (expected {self.magic!r})")
+        reader.position = len(self.magic)
+        if (version := reader.unpack("<B")[0]) != self.version:
+            raise ValueError(
+                f"Unsupported codec version {version} (supported is {self.version})"
+            )
+
+    def _flags(self, item: Item) -> int:
+        result = Flag.inline if self.inline else 0
+        if item.reserver.value is not None:
+            result |= Flag.reserved
+        return result
+
+    def _item(self, writer: Writer, item: Item) -> None:
+        writer.pack("<B", self._flags(item))
+
+        writer.str_(item.kind.value)
+        writer.str_(item.status.value)
+        writer.str_(item.chain.value)
+        writer.timestamp(item.created.value)
+        if item.reserver.value is not None:
+            writer.str_(item.reserver.value)
+
+        writer.data(item.data, inline=self.inline)
+
+        writer.pack("<I", len(item.metadata.value))
+        for k, v in item.metadata.items():
+            writer.str_(k.value)
+            writer.value(v)
+
+    def _data(self, reader: Reader, *, inline: bool) -> Item.Data:
+        algorithm = Algorithm.named(reader.str_())
+        if inline:
+            return Item.Data(value=reader.bytes_(), algorithm=algorithm)
+        digest = Digest(reader.bytes_(), algorithm.name)
+        return Lazy(digest=digest, load=lambda: self._resolved(digest))
+
+    def _resolved(self, digest: Digest) -> Item.Data:
+        result = self.resolve(digest)
+        result.check(digest)
+        return result
+
+    def _decode_item(self, reader: Reader) -> Item:
+        (flags,) = reader.unpack("<B")
+
+        kind = Item.Kind(reader.str_())
+        status = Item.Status(reader.str_())
+        chain = Item.Chain(ref=reader.str_())
+        created = Item.Created(reader.timestamp())
+        reserver = Item.Reserver(reader.str_() if flags & Flag.reserved else None)
+        data = self._data(reader, inline=bool(flags & Flag.inline))
+
+        metadata: Item.Metadata.Mutable = {}
+        for _ in range(reader.unpack("<I")[0]):
+            key = Item.Metadata.Key(reader.str_())
+            metadata[key] = reader.value()
+
+        return Item(
+            kind=kind,
+            status=status,
+            data=data,
+            metadata=Item.Metadata(metadata),
+            chain=chain,
+            created=created,
+            reserver=reserver,
+        )
+
+    def encode(self, item: Item) -> bytes:
+        writer = Writer(io.BytesIO())
+        self._header(writer)
+        self._item(writer, item)
+        return typing.cast(io.BytesIO, writer.stream).getvalue()
+
+    def _decode_whole(self, reader: Reader) -> Item:
+        result = self._decode_item(reader)
+        if reader.position != len(reader.source):
+            raise ValueError("Unexpected data after encoded item")
+        return result
+
+    def decode(self, source: Item.Data.Buffer) -> Item:
+        reader = Reader(memoryview(source))
+        self._check_header(reader)
+        return self._decode_whole(reader)
+
+    def write(self, items: typing.Iterable[Item], stream: typing.BinaryIO) -> None:
+        writer = Writer(stream)
+        self._header(writer)
+        for i in items:
+            body = Writer(io.BytesIO())
+            self._item(body, i)
+            writer.bytes_(typing.cast(io.BytesIO, body.stream).getvalue())
+
+    def read(self, stream: typing.BinaryIO) -> typing.Iterator[Item]:
+        header = Reader(memoryview(stream.read(len(self.magic) + 1)))
+        self._check_header(header)
+        while length := stream.read(8):
+            (size,) = Reader(memoryview(length)).unpack("<Q")
+            if len(body := stream.read(size)) != size:
+                raise ValueError("Unexpected end of encoded item")
+            yield self._decode_whole(Reader(memoryview(body)))
+
+    def encode_many(self, items: typing.Iterable[Item]) -> bytes:
+        stream = io.BytesIO()
+        self.write(items, stream)
+        return stream.getvalue()
+
+    def decode_many(self, source: Item.Data.Buffer) -> typing.Iterator[Item]:
+        return self.read(io.BytesIO(source))
@@ -2,10 +2,16 @@ import datetime
 import dataclasses
 
 
-@dataclasses.dataclass(frozen=True, kw_only=False)
+@dataclasses.dataclass(frozen=True, kw_only=False, slots=True)
 class Created:
     value: datetime.datetime
 
+    @classmethod
+    def trusted(cls, value: datetime.datetime) -> "Created":
+        result = object.__new__(cls)
+        object.__setattr__(result, "value", value)
+        return result
+
     def __post_init__(self):
         if self.value > (now := datetime.datetime.now(datetime.UTC)):
             raise ValueError(
@@ -1,34 +1,83 @@
 import typing
-import hashlib
+import functools
 import dataclasses
 
 from .Digest import Digest
-
-
-def default_algorithm(input_: bytes) -> bytes:
-    return hashlib.sha3_512(input_).digest()
+from .Algorithm import Algorithm, Buffer, sha3_512
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class Data:
     Digest = Digest
+    Algorithm = Algorithm
+    Buffer = Buffer
 
-    value: bytes
+    value: Buffer
     test: Digest | None = dataclasses.field(default=None, compare=False)
-    algorithm: typing.Callable[[bytes], bytes] = default_algorithm
+    algorithm: Algorithm = sha3_512
 
     def __post_init__(self):
-        if (self.test is not None) and (
-            (correct := Data(value=self.value).digest) != self.test
-        ):
-            raise ValueError(
-                f'Provided digest "{self.test}" is not correct (correct is "{correct}")'
-            )
+        if self.test is not None:
+            self.check(self.test)
 
-    @property
+    @classmethod
+    def trusted(cls, *, value: Buffer, digest: Digest) -> "Data":
+        result = Data(value=value, algorithm=Algorithm.named(digest.algorithm))
+        result.__dict__["digest"] = digest
+        return result
+
+    @functools.cached_property
     def digest(self) -> Digest:
-        return Digest(self.algorithm(self.value))
+        return self.algorithm.digest(self.value)
+
+    def digested(self, algorithm: Algorithm) -> "Data":
+        if algorithm == self.algorithm:
+            return self
+        return Data(value=self.value, algorithm=algorithm)
+
+    def check(self, digest: Digest) -> None:
+        if (
+            correct := self.digested(Algorithm.named(digest.algorithm)).digest
+        ) != digest:
+            raise ValueError(
+                f'Provided digest "{digest}" is not correct (correct is "{correct}")'
+            )
 
     @property
     def string(self) -> str:
-        return self.value.decode()
+        return str(self.value, "utf-8")
+
+    def __eq__(self, another: object) -> bool:
+        if not isinstance(another, Data):
+            return NotImplemented
+        if self.algorithm != another.algorithm:
+            return False
+        if ("digest" in self.__dict__) and ("digest" in another.__dict__):
+            return self.digest == another.digest
+        return self.value == another.value
+
+    def __hash__(self) -> int:
+        return hash((self.algorithm, self.digest.value))
+
+
+class Lazy(Data):
+    load: typing.Callable[[], Data]
+
+    def __init__(self, *, digest: Digest, load: typing.Callable[[], Data]):
+        object.__setattr__(self, "test", None)
+        object.__setattr__(self, "algorithm", Algorithm.named(digest.algorithm))
+        object.__setattr__(self, "load", load)
+        self.__dict__["digest"] = digest
+
+    @functools.cached_property
+    def loaded(self) -> Data:
+        return self.load()
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name != "value":
+            raise AttributeError(name)
+        self.__dict__["value"] = self.loaded.value
+        return self.__dict__["value"]
+
+    def __repr__(self) -> str:
+        return f"Lazy(digest={self.digest!r})"
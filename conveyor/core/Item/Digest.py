@@ -1,14 +1,21 @@
 import base64
+import functools
 import dataclasses
 
+default_algorithm = "sha3_512"
+
 
 @dataclasses.dataclass(frozen=True, kw_only=False)
 class Digest:
     value: bytes
+    algorithm: str = default_algorithm
 
     @classmethod
     def from_base64(cls, source: str):
-        return Digest(base64.b64decode(source.encode("ascii")))
+        algorithm, _, value = source.rpartition("-")
+        return Digest(
+            base64.b64decode(value.encode("ascii")), algorithm or default_algorithm
+        )
 
     def __post_init__(self):
         if (given := len(self.value)) < (required := 32):
@@ -17,9 +24,12 @@ class Digest:
                 f"(got {self.value} which is of length {given})"
             )
 
-    @property
+    @functools.cached_property
     def string(self) -> str:
-        return base64.b64encode(self.value).decode("ascii")
+        result = base64.b64encode(self.value).decode("ascii")
+        if self.algorithm == default_algorithm:
+            return result
+        return f"{self.algorithm}-{result}"
 
     def __eq__(self, another: object) -> bool:
         if not isinstance(another, Digest):
@@ -27,4 +37,4 @@ class Digest:
                 "Can not compare instance of type `Digest` "
                 f"with instance of type `{type(another)}`"
             )
-        return self.value == another.value
+        return (self.value == another.value) and (self.algorithm == another.algorithm)
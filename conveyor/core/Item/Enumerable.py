@@ -1,6 +1,6 @@
 import dataclasses
 
 
-@dataclasses.dataclass(frozen=True, kw_only=False)
+@dataclasses.dataclass(frozen=True, kw_only=False, slots=True)
 class Enumerable:
     value: str | None
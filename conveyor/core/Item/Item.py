@@ -9,14 +9,18 @@ from .Reserver import Reserver
 from .Metadata import Metadata
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class Item:
     class Kind(Word):
         """"""
 
+        __slots__ = ()
+
     class Status(Word):
         """"""
 
+        __slots__ = ()
+
     Data = Data
     Chain = Chain
     Created = Created
@@ -26,6 +30,8 @@ class Item:
     class Key(Word):
         """"""
 
+        __slots__ = ()
+
     BaseValue = typing.Union[Data, Kind, Status, Chain, Created, Reserver]
     Value = BaseValue | Metadata.Value
 
@@ -7,11 +7,13 @@ from .Word import Word
 from .Enumerable import Enumerable
 
 
-@dataclasses.dataclass(frozen=True, kw_only=False)
+@dataclasses.dataclass(frozen=True, kw_only=False, slots=True)
 class Metadata:
     class Key(Word):
         """"""
 
+        __slots__ = ()
+
     Value = str | int | float | datetime.datetime | Enumerable | None
 
     Mutable = dict[Key, Value]
@@ -20,9 +22,24 @@ class Metadata:
 
     value_: dict[Key, Value] | types.MappingProxyType[Key, Value]
 
-    @property
-    def value(self) -> types.MappingProxyType[Key, Value]:
-        return types.MappingProxyType(self.value_)
+    value: types.MappingProxyType[Key, Value] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    hash_: int | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        object.__setattr__(self, "value_", dict(self.value_))
+        object.__setattr__(self, "value", types.MappingProxyType(self.value_))
+
+    def __getstate__(self) -> dict[Key, Value]:
+        return typing.cast(dict[Metadata.Key, Metadata.Value], self.value_)
+
+    def __setstate__(self, state: dict[Key, Value]) -> None:
+        object.__setattr__(self, "value_", state)
+        object.__setattr__(self, "hash_", None)
+        self.__post_init__()
 
     def __getitem__(self, key: str | Key) -> Value:
         match key:
@@ -31,12 +48,39 @@ class Metadata:
             case str():
                 return self[Metadata.Key(key)]
 
+    def _has(self, key: Key, value: Value) -> bool:
+        if key not in self.value:
+            return False
+        return (type(self.value[key]) is type(value)) and (self.value[key] == value)
+
     def __or__(self, o: dict[Key, Value] | typing.Mapping[Key, Value]) -> typing.Self:
-        return Metadata(self.value | o)
+        changes = o.value if isinstance(o, Metadata) else o
+        if all(self._has(k, v) for k, v in changes.items()):
+            return self
+        return Metadata(self.value | changes)
 
     def __ror__(self, __value: typing.Any) -> typing.Self:
         return self | __value
 
+    def __hash__(self) -> int:
+        if self.hash_ is None:
+            object.__setattr__(self, "hash_", hash(frozenset(self.value.items())))
+        return typing.cast(int, self.hash_)
+
+    def __eq__(self, another: object) -> bool:
+        if not isinstance(another, Metadata):
+            return NotImplemented
+        if self is another:
+            return True
+        if self._hashes_differ(another):
+            return False
+        return self.value == another.value
+
+    def _hashes_differ(self, another: "Metadata") -> bool:
+        if (self.hash_ is None) or (another.hash_ is None):
+            return False
+        return self.hash_ != another.hash_
+
     def keys(self):
         return self.value.keys()
 
@@ -1,9 +1,10 @@
+import typing
 import dataclasses
 
 from . import Item
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class Part:
     kind_: Item.Kind | None = None
     status_: Item.Status | None = None
@@ -15,8 +16,16 @@ class Part:
     reserver_: Item.Reserver | None = None
 
     def __post_init__(self):
-        if self.data_ is not None:
-            Item.Data(value=self.data_.value, test=self.digest_)
+        if (self.data_ is not None) and (self.digest_ is not None):
+            self.data_.check(self.digest_)
+
+    def trusted(self, **changes: typing.Any) -> "Part":
+        result = object.__new__(Part)
+        for name in Part.__slots__:
+            object.__setattr__(
+                result, name, changes[name] if name in changes else getattr(self, name)
+            )
+        return result
 
     @property
     def item(self) -> Item:
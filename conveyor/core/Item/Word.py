@@ -1,15 +1,31 @@
 import re
+import typing
 import dataclasses
 
 from .Enumerable import Enumerable
 
 
-@dataclasses.dataclass(frozen=True, kw_only=False)
+@dataclasses.dataclass(frozen=True, kw_only=False, slots=True)
 class Word(Enumerable):
     value: str
 
-    regex = re.compile(r"\w+")
+    regex: typing.ClassVar[re.Pattern[str]] = re.compile(r"\w+")
+    interned: typing.ClassVar[dict[tuple[type, str], "Word"]] = {}
+
+    def __new__(cls, *args: typing.Any, **kwargs: typing.Any):
+        value = args[0] if args else kwargs.get("value")
+        if isinstance(value, str) and (
+            (result := Word.interned.get((cls, value))) is not None
+        ):
+            return result
+        return object.__new__(cls)
+
+    def __getnewargs__(self):
+        return (self.value,)
 
     def __post_init__(self):
+        if (type(self), self.value) in Word.interned:
+            return
         if not self.regex.fullmatch(self.value):
             raise TypeError(f"`Word` value must match regex {self.regex}")
+        Word.interned[(type(self), self.value)] = self
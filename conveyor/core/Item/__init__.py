@@ -1,18 +1,23 @@
-from .Data import Data as Data
+from .Data import Data as Data, Lazy as Lazy
+from .Algorithm import Algorithm as Algorithm
 from .Digest import Digest as Digest
 from .Created import Created as Created
 from .Reserver import Reserver as Reserver
 from .Chain import Chain as Chain
 from .Item import Item as Item, Word as Word
 from .Part import Part as Part
+from .Codec import Codec as Codec
 
 __all__ = [
     "Data",
+    "Lazy",
+    "Algorithm",
     "Digest",
     "Created",
     "Reserver",
     "Chain",
     "Item",
     "Part",
+    "Codec",
     "Word",
 ]
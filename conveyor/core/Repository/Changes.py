@@ -0,0 +1,20 @@
+import dataclasses
+
+from ..Item import Item
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Changes:
+    status: Item.Status | None = None
+    metadata: Item.Metadata | None = None
+
+    def __call__(self, item: Item) -> Item:
+        return dataclasses.replace(
+            item,
+            status=item.status if self.status is None else self.status,
+            metadata=(
+                item.metadata
+                if self.metadata is None
+                else item.metadata | self.metadata
+            ),
+        )
@@ -1,10 +1,18 @@
+import typing
 import dataclasses
 
 from ..Item import Item
+from .Predicate import Predicate, Range, In, Not, Null
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class Mask:
+    Predicate = Predicate
+    Range = Range
+    In = In
+    Not = Not
+    Null = Null
+
     kind: Item.Kind
     status: Item.Status | None = None
     data: Item.Data | None = None
@@ -12,3 +20,5 @@ class Mask:
     chain: Item.Chain | None = None
     created: Item.Created | None = None
     reserver: Item.Reserver | None = None
+
+    predicates: typing.Mapping[str, Predicate] = dataclasses.field(default_factory=dict)
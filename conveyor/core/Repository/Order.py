@@ -0,0 +1,49 @@
+import datetime
+import dataclasses
+
+from ..Item import Item
+
+Value = str | int | float | datetime.datetime | None
+
+
+@dataclasses.dataclass(frozen=True, kw_only=False)
+class Order:
+    Value = Value
+    Cursor = tuple[Value, ...]
+
+    keys: tuple[str, ...] = ("created",)
+    descending: bool = False
+
+    def __post_init__(self):
+        if not self.keys:
+            raise ValueError("`Order` must contain at least one key")
+
+    def check(self, cursor: Cursor) -> None:
+        if len(cursor) != len(self.keys):
+            raise ValueError(f"Cursor {cursor} does not match order keys {self.keys}")
+
+    def value(self, item: Item, key: str) -> Value:
+        match key:
+            case "created":
+                return item.created.value
+            case "chain":
+                return item.chain.value
+            case "digest":
+                return item.data.digest.string
+            case _:
+                return self._metadata(item, key)
+
+    def _metadata(self, item: Item, key: str) -> Value:
+        value = item.metadata.value.get(Item.Metadata.Key(key))
+        if not isinstance(value, str | int | float | datetime.datetime | None):
+            raise TypeError(
+                f"Can not order by metadata field `{key}` holding value `{value}`"
+            )
+        return value
+
+    def cursor(self, item: Item) -> Cursor:
+        return tuple(self.value(item, k) for k in self.keys)
+
+    @staticmethod
+    def sortable(cursor: Cursor) -> tuple[tuple[bool, Value], ...]:
+        return tuple((v is not None, v) for v in cursor)
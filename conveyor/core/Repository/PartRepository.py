@@ -6,6 +6,7 @@ import dataclasses
 from ..Item import Item
 from ..Item.Part import Part
 from .Query import Query
+from .Changes import Changes
 
 
 @dataclasses.dataclass(frozen=True)
@@ -14,22 +15,51 @@ class PartRepository(abc.ABC):
     def append(self, item: Item) -> None:
         """"""
 
+    def append_many(self, items: typing.Iterable[Item]) -> None:
+        for i in items:
+            self.append(i)
+
     @abc.abstractmethod
     def get(self, item_query: Query, accumulator: Part) -> typing.Iterable[Part]:
         """"""
 
+    def get_many(
+        self, item_query: Query, accumulators: typing.Sequence[Part]
+    ) -> typing.Iterable[Part]:
+        for a in accumulators:
+            yield from self.get(item_query, a)
+
+    def reserve(
+        self, item_query: Query, reserver: Item.Reserver, accumulator: Part
+    ) -> typing.Iterable[Part]:
+        raise NotImplementedError
+
     def __setitem__(self, old: Item, new: Item) -> None:
         raise NotImplementedError
 
+    def count(self, mask: Query.Mask) -> int:
+        raise NotImplementedError
+
+    def update_where(self, mask: Query.Mask, changes: Changes) -> int:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def __delitem__(self, item: Item) -> None:
         """"""
 
+    def delete_where(
+        self, mask: Query.Mask, deleted: typing.Sequence[Part]
+    ) -> typing.Sequence[Part]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     @contextlib.contextmanager
     def transaction(self) -> typing.Iterator[typing.Self]:
         """"""
 
+    def preload(self) -> None:
+        return None
+
     @abc.abstractmethod
     def __len__(self) -> int:
         """"""
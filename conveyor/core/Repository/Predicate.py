@@ -0,0 +1,97 @@
+import abc
+import typing
+import dataclasses
+
+from ..Item import Item
+
+
+Value = Item.Metadata.Value | Item.Status
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Predicate(abc.ABC):
+    Value = Value
+
+    @staticmethod
+    def described(value: typing.Any) -> typing.Any:
+        if isinstance(value, Item.Metadata.Enumerable):
+            return value.value
+        return value
+
+    @property
+    @abc.abstractmethod
+    def values(self) -> typing.Sequence[Value]:
+        """"""
+
+    @abc.abstractmethod
+    def __call__(self, value: Value) -> bool:
+        """"""
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Range(Predicate):
+    lower: typing.Any = None
+    upper: typing.Any = None
+
+    def __post_init__(self):
+        if (self.lower is None) and (self.upper is None):
+            raise ValueError("`Range` must have at least one bound")
+
+    @property
+    def values(self) -> typing.Sequence[Value]:
+        return tuple(v for v in (self.lower, self.upper) if v is not None)
+
+    def _above(self, value: typing.Any) -> bool:
+        return (self.lower is None) or (value >= self.lower)
+
+    def _below(self, value: typing.Any) -> bool:
+        return (self.upper is None) or (value < self.upper)
+
+    def __call__(self, value: Value) -> bool:
+        return (
+            (self.described(value) is not None)
+            and self._above(value)
+            and self._below(value)
+        )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=False)
+class In(Predicate):
+    options: tuple[Value, ...]
+
+    @property
+    def values(self) -> typing.Sequence[Value]:
+        return self.options
+
+    def __call__(self, value: Value) -> bool:
+        described = self.described(value)
+        return (described is not None) and (
+            described in {self.described(o) for o in self.options}
+        )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=False)
+class Not(Predicate):
+    value: Value
+
+    @property
+    def values(self) -> typing.Sequence[Value]:
+        return (self.value,)
+
+    def __call__(self, value: Value) -> bool:
+        described, excluded = self.described(value), self.described(self.value)
+        return (
+            (described is not None)
+            and (excluded is not None)
+            and (described != excluded)
+        )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Null(Predicate):
+    @property
+    def values(self) -> typing.Sequence[Value]:
+        return ()
+
+    def __call__(self, value: Value) -> bool:
+        return self.described(value) is None
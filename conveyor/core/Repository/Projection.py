@@ -0,0 +1,34 @@
+import typing
+import dataclasses
+
+from ..Item import Item, Part
+
+Field = typing.Literal["status", "data", "chain", "created", "reserver"]
+
+fields: tuple[Field, ...] = ("status", "data", "chain", "created", "reserver")
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Projection:
+    Field = Field
+
+    fields: frozenset[Field] = frozenset()
+    metadata: frozenset[Item.Metadata.Key] = frozenset()
+
+    def __post_init__(self):
+        if unknown := self.fields - set(fields):
+            raise ValueError(
+                f"Can not project unknown fields {sorted(unknown)} "
+                f"(known are {list(fields)})"
+            )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.fields
+
+    def __call__(self, part: Part) -> Part:
+        return part.trusted(
+            metadata_=Item.Metadata(
+                {k: v for k, v in part.metadata.items() if k in self.metadata}
+            ),
+            **{f"{name}_": None for name in fields if name not in self.fields},
+        )
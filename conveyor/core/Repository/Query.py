@@ -1,12 +1,31 @@
 import dataclasses
 
 from .Mask import Mask
+from .Order import Order
+from .Projection import Projection
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class Query:
     Mask = Mask
+    Order = Order
+    Projection = Projection
     Limit = int | None
 
     mask: Mask
     limit: Limit
+
+    order: Order | None = None
+    after: Order.Cursor | None = None
+
+    projection: Projection | None = None
+
+    def __post_init__(self):
+        if self.after is None:
+            return
+        if self.order is None:
+            raise ValueError("`after` cursor requires `order`")
+        self.order.check(self.after)
+
+    def requests(self, field: str) -> bool:
+        return (self.projection is None) or (field in self.projection)
@@ -1,9 +1,11 @@
 import typing
+import itertools
 import contextlib
 import dataclasses
 
 from ..Item.Part import Part
 from .Query import Query
+from .Changes import Changes
 from ..Item.Item import Item
 from .PartRepository import PartRepository
 
@@ -11,20 +13,68 @@ from .PartRepository import PartRepository
 @dataclasses.dataclass(frozen=True, kw_only=False)
 class Repository:
     Parts = typing.Sequence[PartRepository]
+    Changes = Changes
 
     parts: Parts
     transaction_: bool = False
+    algorithm: Item.Data.Algorithm | None = None
+    chunk: int = 16
 
     def __post_init__(self):
         if not self.parts:
             raise ValueError("`parts` must contain at least one element")
+        if self.chunk < 1:
+            raise ValueError("`chunk` must be positive")
 
     def _unreserved(self, item: Item) -> Item:
         return dataclasses.replace(item, reserver=Item.Reserver(None))
 
+    def _digested(self, item: Item) -> Item:
+        if self.algorithm is None:
+            return item
+        return dataclasses.replace(item, data=item.data.digested(self.algorithm))
+
     def append(self, item: Item) -> None:
+        prepared = self._digested(self._unreserved(item))
         for p in reversed(self.parts):
-            p.append(self._unreserved(item))
+            p.append(prepared)
+
+    def append_many(self, items: typing.Iterable[Item]) -> None:
+        prepared = [self._digested(self._unreserved(i)) for i in items]
+        with self.transaction() as t:
+            for p in reversed(t.parts):
+                p.append_many(prepared)
+
+    def _chunks(
+        self, parts: typing.Iterable[Part]
+    ) -> typing.Iterable[tuple[Part, ...]]:
+        iterator = iter(parts)
+        size = 1
+        while chunk := (*itertools.islice(iterator, size),):
+            yield chunk
+            size = min(size * 2, self.chunk)
+
+    def _complete(
+        self,
+        query: Query,
+        repositories: typing.Sequence[PartRepository],
+        parts: typing.Sequence[Part],
+    ) -> typing.Sequence[Part]:
+        for r in repositories:
+            parts = (*r.get_many(query, parts),)
+        return parts
+
+    def _parts(
+        self,
+        query: Query,
+        repositories: typing.Sequence[PartRepository],
+        parts: typing.Iterable[Part] | None = None,
+    ) -> typing.Iterable[Part]:
+        if parts is None:
+            parts = repositories[0].get(query, Part())
+            repositories = repositories[1:]
+        for chunk in self._chunks(parts):
+            yield from self._complete(query, repositories, chunk)
 
     def _get(
         self,
@@ -32,19 +82,19 @@ class Repository:
         repositories: typing.Sequence[PartRepository],
         parts: typing.Iterable[Part] | None = None,
     ) -> typing.Iterable[Item]:
-        parts = parts or (Part(),)
-        if repositories:
-            for p in parts:
-                yield from self._get(
-                    query=query,
-                    repositories=repositories[1:],
-                    parts=repositories[0].get(query, p),
-                )
-        else:
-            for p in parts:
-                yield p.item
+        return (p.item for p in self._parts(query, repositories, parts))
+
+    def view(self, item_query: Query) -> typing.Iterable[Part]:
+        return self._parts(item_query, self.parts)
+
+    def _writable(self, item_query: Query) -> None:
+        if item_query.projection is not None:
+            raise ValueError(
+                "Projected query can not reserve items, use `Repository.view`"
+            )
 
     def __getitem__(self, item_query: Query) -> typing.Iterable[Item]:
+        self._writable(item_query)
         reserver = Item.Reserver()
         got: int = 0
 
@@ -66,6 +116,24 @@ class Repository:
             if got == item_query.limit:
                 break
 
+    def reserve(self, item_query: Query, n: Query.Limit) -> typing.Sequence[Item]:
+        self._writable(item_query)
+        query = dataclasses.replace(
+            item_query,
+            mask=dataclasses.replace(item_query.mask, reserver=Item.Reserver(None)),
+            limit=n,
+        )
+
+        with self.transaction() as t:
+            try:
+                reserved = (*t.parts[0].reserve(query, Item.Reserver(), Part()),)
+            except NotImplementedError:
+                return (*t[query],)
+
+            if not reserved:
+                return ()
+            return (*t._get(query=query, repositories=t.parts[1:], parts=reserved),)
+
     def _setitem(self, old: Item, new: Item):
         with self.transaction() as t:
             for p in reversed(t.parts):
@@ -85,6 +153,37 @@ class Repository:
                 except KeyError:
                     break
 
+    def _matching(self, mask: Query.Mask) -> typing.Sequence[Item]:
+        return (
+            *self._get(query=Query(mask=mask, limit=None), repositories=self.parts),
+        )
+
+    def update_where(self, mask: Query.Mask, changes: Changes) -> int:
+        with self.transaction() as t:
+            try:
+                return t.parts[0].update_where(mask, changes)
+            except NotImplementedError:
+                matching = t._matching(mask)
+                for i in matching:
+                    t._setitem(i, changes(i))
+                return len(matching)
+
+    def delete_where(self, mask: Query.Mask) -> int:
+        with self.transaction() as t:
+            try:
+                deleted = t.parts[0].delete_where(mask, ())
+            except NotImplementedError:
+                matching = t._matching(mask)
+                for i in matching:
+                    del t[i]
+                return len(matching)
+            for p in t.parts[1:]:
+                try:
+                    p.delete_where(mask, deleted)
+                except NotImplementedError:
+                    """"""
+            return len(deleted)
+
     @contextlib.contextmanager
     def _transaction(
         self, parts_to_include: typing.Sequence[PartRepository]
@@ -109,6 +208,18 @@ class Repository:
                         self, parts=transaction_parts, transaction_=True
                     )
 
+    def count(self, mask: Query.Mask) -> int:
+        try:
+            return self.parts[0].count(mask)
+        except NotImplementedError:
+            return sum(
+                1 for _ in self.parts[0].get(Query(mask=mask, limit=None), Part())
+            )
+
+    def preload(self) -> None:
+        for p in self.parts:
+            p.preload()
+
     def __len__(self) -> int:
         return max(len(p) for p in self.parts)
 
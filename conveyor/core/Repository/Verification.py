@@ -0,0 +1,93 @@
+import abc
+import typing
+import itertools
+import dataclasses
+
+from ..Item import Data, Digest, Algorithm
+
+
+@dataclasses.dataclass(kw_only=True)
+class Statistics:
+    verified: int = 0
+    verified_bytes: int = 0
+    skipped: int = 0
+    failures: int = 0
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Verification(abc.ABC):
+    Statistics = Statistics
+
+    statistics: Statistics = dataclasses.field(default_factory=Statistics)
+
+    @abc.abstractmethod
+    def required(self, digest: Digest) -> bool:
+        """"""
+
+    @abc.abstractmethod
+    def passed(self, digest: Digest) -> None:
+        """"""
+
+    @typing.final
+    def __call__(self, value: Data.Buffer, digest: Digest) -> Data:
+        if not self.required(digest):
+            self.statistics.skipped += 1
+            return Data.trusted(value=value, digest=digest)
+
+        try:
+            result = Data(
+                value=value, test=digest, algorithm=Algorithm.named(digest.algorithm)
+            )
+        except ValueError:
+            self.statistics.failures += 1
+            raise
+
+        self.statistics.verified += 1
+        self.statistics.verified_bytes += memoryview(value).nbytes
+        self.passed(digest)
+        return result
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Always(Verification):
+    def required(self, digest: Digest) -> bool:
+        return True
+
+    def passed(self, digest: Digest) -> None:
+        """"""
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Once(Verification):
+    seen: set[tuple[str, bytes]] = dataclasses.field(default_factory=set)
+
+    def required(self, digest: Digest) -> bool:
+        return (digest.algorithm, digest.value) not in self.seen
+
+    def passed(self, digest: Digest) -> None:
+        self.seen.add((digest.algorithm, digest.value))
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Sampled(Verification):
+    n: int
+    counter: typing.Iterator[int] = dataclasses.field(default_factory=itertools.count)
+
+    def __post_init__(self):
+        if self.n < 1:
+            raise ValueError(f"`Sampled` n must be positive (got {self.n})")
+
+    def required(self, digest: Digest) -> bool:
+        return not next(self.counter) % self.n
+
+    def passed(self, digest: Digest) -> None:
+        """"""
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Never(Verification):
+    def required(self, digest: Digest) -> bool:
+        return False
+
+    def passed(self, digest: Digest) -> None:
+        """"""
@@ -37,11 +37,26 @@ class Actor:
     ) -> None:
         actions = (*actions,)
         with repository.transaction() as t:
-            for a in functools.reduce(
-                lambda result, p: p(lambda: result, {}), self.processors, actions
+            for a in self._batched(
+                functools.reduce(
+                    lambda result, p: p(lambda: result, {}), self.processors, actions
+                )
             ):
                 a(t)
 
+    def _batched(self, actions: typing.Iterable[Action]) -> typing.Iterable[Action]:
+        appends: list[Item] = []
+        for a in actions:
+            if type(a) is Append:
+                appends.append(a.new)
+                continue
+            if appends:
+                yield AppendMany(appends)
+                appends = []
+            yield a
+        if appends:
+            yield AppendMany(appends)
+
 
 @dataclasses.dataclass(frozen=True, kw_only=False)
 class Append(Action):
@@ -55,6 +70,19 @@ class Append(Action):
         yield ("item", self.new)
 
 
+@dataclasses.dataclass(frozen=True, kw_only=False)
+class AppendMany(Action):
+    new: typing.Sequence[Item]
+
+    def __call__(self, repository: Repository) -> None:
+        repository.append_many(self.new)
+
+    @property
+    def info(self):
+        for i in self.new:
+            yield ("item", i)
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class Update(Action):
     old: Item
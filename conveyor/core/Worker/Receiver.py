@@ -14,6 +14,7 @@ class Receiver:
 
     masks: Masks
     limit: Query.Limit
+    order: Query.Order | None = None
 
     def sequence(
         self, repository: Repository, first: Item, masks: Masks
@@ -37,7 +38,9 @@ class Receiver:
         sequence: typing.Iterable[Item] = ()
 
         for f in iterator:
-            for first in repository[Query(mask=f(sequence), limit=self.limit)]:
+            for first in repository[
+                Query(mask=f(sequence), limit=self.limit, order=self.order)
+            ]:
                 sequence = (*self.sequence(repository, first, copy.deepcopy(iterator)),)
                 yield sequence
             break
@@ -1,4 +1,5 @@
 import typing
+import threading
 import contextlib
 import dataclasses
 
@@ -17,6 +18,15 @@ class Worker:
     actor: Actor = Actor()
     repository: Repository
 
+    preloaded: threading.Event = dataclasses.field(
+        default_factory=threading.Event, repr=False, compare=False
+    )
+
+    def _preload(self):
+        if not self.preloaded.is_set():
+            self.repository.preload()
+            self.preloaded.set()
+
     def _with_receiver(self, receiver: Receiver, config: typing.Any = None):
         iterator = iter(receiver(self.repository))
         with contextlib.suppress(RuntimeError):
@@ -27,6 +37,7 @@ class Worker:
         self.actor(self.processor(tuple, config), self.repository)
 
     def __call__(self, config: typing.Any = None):
+        self._preload()
         if self.receiver is None:
             self._without_receiver(config)
         else:
@@ -83,21 +83,17 @@ class Logger(Processor[Action.Action, Action.Action]):
         yield Solution(ref=a, kind=self.errors)
 
     def info(self, a: Action.Action):
-        result = Item.Metadata({})
+        result: Item.Metadata.Mutable = {}
         for k, v in a.info:
             match v:
                 case Item.Metadata.Value:
-                    result = result | {Item.Metadata.Key(f"action_{k}"): v}
+                    result[Item.Metadata.Key(f"action_{k}")] = v
                 case Item():
-                    result = result | {
-                        Item.Metadata.Key(f"action_{k}_type"): v.kind.value
-                    }
-                    result = result | {
-                        Item.Metadata.Key(f"action_{k}_status"): v.status.value
-                    }
+                    result[Item.Metadata.Key(f"action_{k}_type")] = v.kind.value
+                    result[Item.Metadata.Key(f"action_{k}_status")] = v.status.value
                 case _:
                     """"""
-        return result
+        return Item.Metadata(result)
 
     def entry(self, a: Action.Action):
         return Item(
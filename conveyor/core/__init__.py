@@ -1,8 +1,11 @@
 from .Item.Item import Item as Item
 from .Repository.Mask import Mask as Mask
 from .Repository.Query import Query as Query
+from .Repository.Changes import Changes as Changes
 from .Item.Part import Part as Part
+from .Item.Codec import Codec as Codec
 from .Repository.PartRepository import PartRepository as PartRepository
+from .Repository import Verification as Verification
 from .Repository.Repository import Repository as Repository
 from . import Transforms as Transforms
 
@@ -10,8 +13,11 @@ __all__ = [
     "Item",
     "Mask",
     "Query",
+    "Changes",
     "Part",
+    "Codec",
     "PartRepository",
     "Repository",
+    "Verification",
     "Transforms",
 ]
@@ -0,0 +1,94 @@
+import typing
+import contextlib
+import dataclasses
+
+from ...core import Item, Part, Query, Changes, PartRepository
+from ...core.Item import Lazy
+from .Core.Core import Core
+
+
+@dataclasses.dataclass(frozen=True, kw_only=False)
+class Cache(PartRepository):
+    Core = Core
+
+    part: PartRepository
+    cache: Core
+
+    def append(self, item: Item) -> None:
+        return self.part.append(item)
+
+    def append_many(self, items: typing.Iterable[Item]) -> None:
+        return self.part.append_many(items)
+
+    def _through(self, data: Item.Data) -> Item.Data:
+        match data:
+            case Lazy():
+                return Lazy(digest=data.digest, load=lambda: self.cache.put(data))
+            case _:
+                return self.cache.put(data)
+
+    def get(self, item_query: Query, accumulator: Part) -> typing.Iterable[Part]:
+        if not item_query.requests("data"):
+            yield from self.part.get(item_query, accumulator)
+            return
+        if (cached := self.cache[accumulator.digest]) is not None:
+            yield accumulator.trusted(data_=cached)
+            return
+        for p in self.part.get(item_query, accumulator):
+            yield p.trusted(data_=self._through(p.data))
+
+    def get_many(
+        self, item_query: Query, accumulators: typing.Sequence[Part]
+    ) -> typing.Iterable[Part]:
+        if not item_query.requests("data"):
+            return self.part.get_many(item_query, accumulators)
+        return self._with_data(item_query, accumulators)
+
+    def _cached(
+        self, accumulators: typing.Sequence[Part]
+    ) -> dict[Item.Data.Digest, Item.Data | None]:
+        return {a.digest: self.cache[a.digest] for a in accumulators}
+
+    def _with_data(
+        self, item_query: Query, accumulators: typing.Sequence[Part]
+    ) -> typing.Iterable[Part]:
+        data = self._cached(accumulators)
+        missing = [a for a in accumulators if data[a.digest] is None]
+        for p in self.part.get_many(item_query, missing):
+            data[p.digest] = self._through(p.data)
+        for a in accumulators:
+            yield a.trusted(data_=data[a.digest])
+
+    def count(self, mask: Query.Mask) -> int:
+        return self.part.count(mask)
+
+    def __setitem__(self, old: Item, new: Item) -> None:
+        self.part[old] = new
+
+    def update_where(self, mask: Query.Mask, changes: Changes) -> int:
+        return self.part.update_where(mask, changes)
+
+    def __delitem__(self, item: Item) -> None:
+        self.cache.discard((item.data.digest,))
+        del self.part[item]
+
+    def delete_where(
+        self, mask: Query.Mask, deleted: typing.Sequence[Part]
+    ) -> typing.Sequence[Part]:
+        self.cache.discard(p.digest for p in deleted)
+        return self.part.delete_where(mask, deleted)
+
+    @contextlib.contextmanager
+    def transaction(self) -> typing.Iterator[typing.Self]:
+        with self.part.transaction() as t:
+            yield dataclasses.replace(self, part=t)
+
+    def preload(self) -> None:
+        self.part.preload()
+
+    def __len__(self) -> int:
+        return len(self.part)
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self.part.clear()
@@ -0,0 +1,151 @@
+import typing
+import shutil
+import pathlib
+import collections
+import dataclasses
+
+from ....core import Verification
+from ....core.Item import Data, Digest
+
+
+@dataclasses.dataclass(kw_only=True)
+class Statistics:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    disk_evictions: int = 0
+    disk_size: int = 0
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Core:
+    Statistics = Statistics
+    Verification = Verification
+
+    capacity: int
+    root: pathlib.Path | None = None
+    disk_capacity: int = 2**30
+
+    verification: Verification.Verification = dataclasses.field(
+        default_factory=Verification.Always
+    )
+
+    statistics: Statistics = dataclasses.field(default_factory=Statistics)
+    entries: collections.OrderedDict[Digest, bytes] = dataclasses.field(
+        default_factory=collections.OrderedDict, repr=False
+    )
+    stored: collections.OrderedDict[str, int] = dataclasses.field(
+        default_factory=collections.OrderedDict, repr=False
+    )
+
+    def __post_init__(self):
+        if self.capacity < 0:
+            raise ValueError(f"`capacity` must not be negative (got {self.capacity})")
+        if self.disk_capacity < 0:
+            raise ValueError(
+                f"`disk_capacity` must not be negative (got {self.disk_capacity})"
+            )
+        self._scan()
+
+    def _scan(self) -> None:
+        if (self.root is None) or not self.root.exists():
+            return
+        for p in sorted(self.root.iterdir(), key=lambda p: p.stat().st_mtime):
+            self._stored(p.name, p.stat().st_size)
+
+    def path(self, digest: Digest) -> pathlib.Path:
+        if self.root is None:
+            raise ValueError("Cache has no `root` to store data on disk")
+        return self.root / f"{digest.algorithm}-{digest.value.hex()}"
+
+    def _remember(self, digest: Digest, value: bytes) -> None:
+        if len(value) > self.capacity:
+            return
+        self.entries[digest] = value
+        self.statistics.size += len(value)
+        while self.statistics.size > self.capacity:
+            _, evicted = self.entries.popitem(last=False)
+            self.statistics.size -= len(evicted)
+            self.statistics.evictions += 1
+
+    def _stored(self, name: str, size: int) -> None:
+        self.statistics.disk_size += size - self.stored.pop(name, 0)
+        self.stored[name] = size
+        while self.statistics.disk_size > self.disk_capacity:
+            self._unstored(next(iter(self.stored)))
+            self.statistics.disk_evictions += 1
+
+    def _unstored(self, name: str) -> None:
+        if (size := self.stored.pop(name, None)) is not None:
+            self.statistics.disk_size -= size
+        if self.root is not None:
+            (self.root / name).unlink(missing_ok=True)
+
+    def _memory(self, digest: Digest) -> Data | None:
+        if (value := self.entries.get(digest)) is None:
+            return None
+        self.entries.move_to_end(digest)
+        self.statistics.hits += 1
+        return Data.trusted(value=value, digest=digest)
+
+    def _disk(self, digest: Digest) -> Data | None:
+        if self.root is None:
+            return None
+        path = self.path(digest)
+        try:
+            result = self.verification(path.read_bytes(), digest)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            self._unstored(path.name)
+            return None
+        if path.name in self.stored:
+            self.stored.move_to_end(path.name)
+        self.statistics.disk_hits += 1
+        self._remember(digest, bytes(result.value))
+        return result
+
+    def __getitem__(self, digest: Digest) -> Data | None:
+        for source in (self._memory, self._disk):
+            if (result := source(digest)) is not None:
+                return result
+        self.statistics.misses += 1
+        return None
+
+    def _store(self, digest: Digest, value: Data.Buffer) -> None:
+        size = memoryview(value).nbytes
+        if (self.root is None) or (size > self.disk_capacity):
+            return
+        path = self.path(digest)
+        temp = path.with_suffix(".tmp")
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp.write_bytes(value)
+        temp.replace(path)
+        self._stored(path.name, size)
+
+    def put(self, data: Data) -> Data:
+        if data.digest in self.entries:
+            return data
+        self._store(data.digest, data.value)
+        if memoryview(data.value).nbytes > self.capacity:
+            return data
+        value = bytes(data.value)
+        self._remember(data.digest, value)
+        return Data.trusted(value=value, digest=data.digest)
+
+    def discard(self, digests: typing.Iterable[Digest]) -> None:
+        for d in digests:
+            if (value := self.entries.pop(d, None)) is not None:
+                self.statistics.size -= len(value)
+            if self.root is not None:
+                self._unstored(self.path(d).name)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.stored.clear()
+        self.statistics.size = 0
+        self.statistics.disk_size = 0
+        if self.root is not None:
+            shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,3 @@
+from .Cache import Cache as Cache
+
+__all__ = ["Cache"]
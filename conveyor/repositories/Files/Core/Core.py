@@ -1,12 +1,14 @@
+import os
+import mmap
 import typing
 import shutil
 import pathlib
 import contextlib
 import dataclasses
 
-from conveyor.core.Item import Digest, Data
+from conveyor.core.Item import Digest, Data, Algorithm
 
-from ....core import Transforms
+from ....core import Transforms, Verification
 from .Pathify import Pathify
 from .Transaction import Transaction
 
@@ -15,6 +17,7 @@ from .Transaction import Transaction
 class Core:
     Transforms = Transforms
     Pathify = Pathify
+    Verification = Verification
 
     root: pathlib.Path
     suffix: str
@@ -25,13 +28,18 @@ class Core:
 
     transaction_: Transaction | None = None
 
-    empty: Digest = Data(value=b"").digest
+    map_threshold: int | None = 2**20
+    maps: contextlib.ExitStack | None = None
+
+    verification: Verification.Verification = dataclasses.field(
+        default_factory=Verification.Always
+    )
 
     def path(self, digest: Digest) -> pathlib.Path:
         return pathlib.Path(self.root, self.pathify(digest)).with_suffix(self.suffix)
 
     def append(self, data: Data) -> None:
-        if not data.value:
+        if data.digest == data.algorithm.empty:
             return
 
         with self.transaction() as t:
@@ -42,28 +50,81 @@ class Core:
                     path=self.path(data.digest),
                     data=data.value,
                     transforms=self.prepare,
-                    equal_path=lambda b: self.path(Data(value=b).digest),
+                    equal_path=lambda b: self.path(
+                        Data(value=b, algorithm=data.algorithm).digest
+                    ),
                     equal_data=self.sidestep,
                 )
             )
 
+    def append_many(self, data: typing.Iterable[Data]) -> None:
+        with self.transaction() as t:
+            appended: set[Digest] = set()
+            for d in data:
+                if d.digest not in appended:
+                    t.append(d)
+                    appended.add(d.digest)
+
     def __getitem__(self, digest: Digest) -> Data:
-        if digest == self.empty:
-            return Data(value=b"")
+        algorithm = Algorithm.named(digest.algorithm)
+        if digest == algorithm.empty:
+            return Data(value=b"", algorithm=algorithm)
 
         try:
-            return Data(
-                value=(~self.prepare)(self.path(digest).read_bytes()), test=digest
-            )
+            return self.verification(self._read(self.path(digest)), digest)
         except FileNotFoundError as e:
             raise KeyError(f"{self.root} {digest.string}") from e
 
+    def get_many(self, digests: typing.Iterable[Digest]) -> dict[Digest, Data]:
+        return {d: self[d] for d in sorted(set(digests), key=self.path)}
+
+    @contextlib.contextmanager
+    def mapped(self) -> typing.Iterator[typing.Self]:
+        with contextlib.ExitStack() as maps:
+            yield dataclasses.replace(self, maps=maps)
+
+    def _mappable(self) -> bool:
+        return (self.map_threshold is not None) and isinstance(
+            self.prepare, Transforms.Nothing
+        )
+
+    @staticmethod
+    def _unmap(mapping: mmap.mmap) -> None:
+        try:
+            mapping.close()
+        except BufferError:
+            """"""
+
+    def _map(self, maps: contextlib.ExitStack, fileno: int, size: int) -> memoryview:
+        mapping = mmap.mmap(fileno, size, access=mmap.ACCESS_READ)
+        maps.callback(self._unmap, mapping)
+        view = memoryview(mapping)
+        maps.callback(view.release)
+        return view
+
+    def _read(self, path: pathlib.Path) -> Data.Buffer:
+        if (self.maps is None) or not self._mappable():
+            return (~self.prepare)(path.read_bytes())
+
+        with path.open("rb") as f:
+            if (size := os.fstat(f.fileno()).st_size) < max(self.map_threshold or 0, 1):
+                return f.read()
+            return self._map(self.maps, f.fileno(), size)
+
     def __delitem__(self, digest: Digest) -> None:
         with self.transaction() as t:
             if t.transaction_ is None:
                 raise ValueError
             t.transaction_.append(Transaction.Delete(self.path(digest)))
 
+    def delete_many(self, digests: typing.Iterable[Digest]) -> None:
+        with self.transaction() as t:
+            if t.transaction_ is None:
+                raise ValueError
+            for path in {self.path(d) for d in digests}:
+                if path.exists():
+                    t.transaction_.append(Transaction.Delete(path))
+
     @property
     def _transaction(self):
         if self.transaction_ is None:
@@ -1,15 +1,27 @@
+import os
 import abc
 import typing
 import pathlib
 import dataclasses
 
-from ....core.Transforms import Transform
+from ....core.Transforms import Transform, Nothing
 
 
 class Collision(Exception):
     """"""
 
 
+def same(path: pathlib.Path, data: bytes | memoryview, chunk: int = 2**20) -> bool:
+    view = memoryview(data)
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size != view.nbytes:
+            return False
+        for start in range(0, view.nbytes, chunk):
+            if f.read(chunk) != view[start : start + chunk]:
+                return False
+    return True
+
+
 @dataclasses.dataclass(frozen=True, kw_only=False)
 class Action(abc.ABC):
     path: pathlib.Path
@@ -40,7 +52,7 @@ class Action(abc.ABC):
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class Append(Action):
-    data: bytes
+    data: bytes | memoryview
     transforms: Transform[bytes, bytes]
 
     equal_path: typing.Callable[[bytes], pathlib.Path]
@@ -54,16 +66,22 @@ class Append(Action):
 
     @property
     def equal(self) -> typing.Self:
-        data = self.equal_data(self.data)
+        data = self.equal_data(bytes(self.data))
         return dataclasses.replace(self, path=self.equal_path(data), data=data)
 
+    @property
+    def transformed(self) -> bytes | memoryview:
+        if isinstance(self.transforms, Nothing):
+            return self.data
+        return self.transforms(bytes(self.data))
+
     def prepare(self) -> None:
         action: typing.Self = self
-        transformed = self.transforms(self.data)
+        transformed = self.transformed
 
         while True:
             if action.path.exists():
-                if transformed != action.path.read_bytes():
+                if not same(action.path, transformed):
                     action = action.equal
                     continue
                 else:
@@ -79,7 +97,7 @@ class Append(Action):
         try:
             action.temp.rename(action.path)
         except (FileExistsError, FileNotFoundError) as e:
-            if action.data != action.path.read_bytes():
+            if not same(action.path, action.data):
                 raise Collision(str(action.path)) from e
 
     def commit(self) -> None:
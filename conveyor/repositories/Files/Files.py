@@ -3,6 +3,7 @@ import dataclasses
 import typing
 
 from ...core import Item, Part, PartRepository, Query
+from ...core.Item import Lazy
 from .Core.Core import Core
 
 
@@ -11,17 +12,58 @@ class Files(PartRepository):
     Core = Core
 
     files: Core
+    lazy: bool = False
 
     def append(self, item: Item) -> None:
         return self.files.append(item.data)
 
+    def append_many(self, items: typing.Iterable[Item]) -> None:
+        return self.files.append_many(i.data for i in items)
+
+    def _lazy(self, digest: Item.Data.Digest) -> Item.Data:
+        return Lazy(digest=digest, load=lambda: self.files[digest])
+
     def get(self, item_query: Query, accumulator: Part) -> typing.Iterable[Part]:
-        data = self.files[accumulator.digest]
-        yield dataclasses.replace(accumulator, data_=data)
+        if not item_query.requests("data"):
+            yield accumulator
+            return
+        digest = accumulator.digest
+        if self.lazy:
+            data = self._lazy(digest)
+        else:
+            data = self.files[digest]
+        yield accumulator.trusted(data_=data)
+
+    def get_many(
+        self, item_query: Query, accumulators: typing.Sequence[Part]
+    ) -> typing.Iterable[Part]:
+        if not item_query.requests("data"):
+            return accumulators
+        return self._with_data(accumulators)
+
+    def _with_data(self, accumulators: typing.Sequence[Part]) -> typing.Iterable[Part]:
+        digests = {a.digest for a in accumulators}
+        if self.lazy:
+            data = {d: self._lazy(d) for d in digests}
+        else:
+            data = self.files.get_many(digests)
+        for a in accumulators:
+            yield a.trusted(data_=data[a.digest])
 
     def __delitem__(self, item: Item) -> None:
         del self.files[item.data.digest]
 
+    def delete_where(
+        self, mask: Query.Mask, deleted: typing.Sequence[Part]
+    ) -> typing.Sequence[Part]:
+        self.files.delete_many(p.digest for p in deleted)
+        return deleted
+
+    @contextlib.contextmanager
+    def mapped(self) -> typing.Iterator[typing.Self]:
+        with self.files.mapped() as m:
+            yield dataclasses.replace(self, files=m)
+
     @contextlib.contextmanager
     def transaction(self) -> typing.Iterator[typing.Self]:
         with self.files.transaction() as t:
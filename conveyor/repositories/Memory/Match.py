@@ -0,0 +1,75 @@
+import typing
+import itertools
+import dataclasses
+
+from ...core import Item, Query
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Match:
+    fields: typing.ClassVar[
+        dict[str, typing.Callable[[Item], Query.Mask.Predicate.Value]]
+    ] = {
+        "status": lambda i: i.status,
+        "chain": lambda i: i.chain.value,
+        "created": lambda i: i.created.value,
+        "reserver": lambda i: i.reserver.value,
+        "digest": lambda i: i.data.digest.string,
+    }
+
+    mask: Query.Mask
+    item: Item
+
+    def __bool__(self) -> bool:
+        return all(
+            itertools.chain(
+                self.status,
+                self.data,
+                self.chain,
+                self.created,
+                self.reserver,
+                self.metadata,
+                self.predicates,
+            )
+        )
+
+    def field(self, name: str) -> Query.Mask.Predicate.Value:
+        if (get := self.fields.get(name)) is not None:
+            return get(self.item)
+        return self.item.metadata.value.get(Item.Metadata.Key(name))
+
+    @property
+    def status(self):
+        if self.mask.status is not None:
+            yield self.item.status == self.mask.status
+
+    @property
+    def data(self):
+        if self.mask.data is not None:
+            yield self.item.data.digest == self.mask.data.digest
+
+    @property
+    def chain(self):
+        if self.mask.chain is not None:
+            yield self.item.chain.value == self.mask.chain.value
+
+    @property
+    def created(self):
+        if self.mask.created is not None:
+            yield self.item.created == self.mask.created
+
+    @property
+    def reserver(self):
+        if self.mask.reserver is not None:
+            yield self.item.reserver.value == self.mask.reserver.value
+
+    @property
+    def metadata(self):
+        if self.mask.metadata is not None:
+            for k, v in self.mask.metadata.items():
+                yield (k in self.item.metadata.value) and (self.item.metadata[k] == v)
+
+    @property
+    def predicates(self):
+        for name, p in self.mask.predicates.items():
+            yield p(self.field(name))
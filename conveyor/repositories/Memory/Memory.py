@@ -0,0 +1,116 @@
+import typing
+import contextlib
+import dataclasses
+
+from ...core import Item, Part, Query, Changes, PartRepository
+
+from .Table import Table
+
+Journal = list[tuple[Item.Kind, int, Item | None]]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Memory(PartRepository):
+    Table = Table
+
+    indexed: frozenset[Item.Metadata.Key] = frozenset()
+
+    tables: dict[Item.Kind, Table] = dataclasses.field(default_factory=dict)
+    journal: Journal | None = None
+
+    def _table(self, kind: Item.Kind) -> Table:
+        if (result := self.tables.get(kind)) is None:
+            result = self.tables[kind] = Table(indexed=self.indexed)
+        return result
+
+    def _put(self, kind: Item.Kind, id_: int, item: Item | None) -> None:
+        previous = self._table(kind).put(id_, item)
+        if self.journal is not None:
+            self.journal.append((kind, id_, previous))
+
+    def _part(self, accumulator: Part, item: Item) -> Part:
+        return accumulator.trusted(
+            kind_=item.kind,
+            status_=item.status,
+            data_=item.data,
+            digest_=item.data.digest,
+            metadata_=item.metadata,
+            chain_=item.chain,
+            created_=item.created,
+            reserver_=item.reserver,
+        )
+
+    def _projected(self, query: Query, part: Part) -> Part:
+        if query.projection is None:
+            return part
+        return query.projection(part)
+
+    def _found(self, query: Query) -> dict[int, Item]:
+        table = self._table(query.mask.kind)
+        return {i: table.items[i] for i in table.find(query)}
+
+    def append(self, item: Item) -> None:
+        self._put(item.kind, next(self._table(item.kind).counter), item)
+
+    def get(self, item_query: Query, accumulator: Part) -> typing.Iterable[Part]:
+        for item in self._found(item_query).values():
+            yield self._projected(item_query, self._part(accumulator, item))
+
+    def reserve(
+        self, item_query: Query, reserver: Item.Reserver, accumulator: Part
+    ) -> typing.Iterable[Part]:
+        result: list[Part] = []
+        with self.transaction() as t:
+            for i, item in t._found(item_query).items():
+                reserved = dataclasses.replace(item, reserver=reserver)
+                t._put(item.kind, i, reserved)
+                result.append(t._projected(item_query, t._part(accumulator, reserved)))
+        return result
+
+    def count(self, mask: Query.Mask) -> int:
+        return len(self._table(mask.kind).find(Query(mask=mask, limit=None)))
+
+    def __setitem__(self, old: Item, new: Item) -> None:
+        self._put(old.kind, self._table(old.kind).exact(old), new)
+
+    def update_where(self, mask: Query.Mask, changes: Changes) -> int:
+        found = self._found(Query(mask=mask, limit=None))
+        with self.transaction() as t:
+            for i, item in found.items():
+                t._put(mask.kind, i, changes(item))
+        return len(found)
+
+    def __delitem__(self, item: Item) -> None:
+        self._put(item.kind, self._table(item.kind).exact(item), None)
+
+    def delete_where(
+        self, mask: Query.Mask, deleted: typing.Sequence[Part]
+    ) -> typing.Sequence[Part]:
+        found = self._found(Query(mask=mask, limit=None))
+        with self.transaction() as t:
+            for i in found:
+                t._put(mask.kind, i, None)
+        return (*(self._part(Part(), item) for item in found.values()),)
+
+    def _rollback(self, journal: Journal, start: int) -> None:
+        for kind, id_, previous in reversed(journal[start:]):
+            self.tables[kind].put(id_, previous)
+        del journal[start:]
+
+    @contextlib.contextmanager
+    def transaction(self) -> typing.Iterator[typing.Self]:
+        journal: Journal = [] if self.journal is None else self.journal
+        start = len(journal)
+        try:
+            yield dataclasses.replace(self, journal=journal)
+        except Exception:
+            self._rollback(journal, start)
+            raise
+
+    def __len__(self) -> int:
+        return sum(len(t.items) for t in self.tables.values())
+
+    def clear(self) -> None:
+        for kind, table in self.tables.items():
+            for i in (*table.items,):
+                self._put(kind, i, None)
@@ -0,0 +1,121 @@
+import typing
+import itertools
+import functools
+import dataclasses
+
+from ...core import Item, Query
+
+from .Match import Match
+
+Index = dict[typing.Hashable, set[int]]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Table:
+    Match = Match
+
+    indexed: frozenset[Item.Metadata.Key]
+
+    items: dict[int, Item] = dataclasses.field(default_factory=dict)
+    indexes: dict[str, Index] = dataclasses.field(default_factory=dict)
+    counter: typing.Iterator[int] = dataclasses.field(default_factory=itertools.count)
+
+    def _keys(self, item: Item) -> typing.Iterable[tuple[str, typing.Hashable]]:
+        yield "status", item.status.value
+        yield "reserver", item.reserver.value
+        yield "chain", item.chain.value
+        for k in self.indexed:
+            yield k.value, item.metadata.value.get(k)
+
+    def _mask_metadata(self, mask: Query.Mask):
+        if mask.metadata is not None:
+            for k, v in mask.metadata.items():
+                if k in self.indexed:
+                    yield k.value, v
+
+    def _mask_keys(
+        self, mask: Query.Mask
+    ) -> typing.Iterable[tuple[str, typing.Hashable]]:
+        if mask.status is not None:
+            yield "status", mask.status.value
+        if mask.reserver is not None:
+            yield "reserver", mask.reserver.value
+        if mask.chain is not None:
+            yield "chain", mask.chain.value
+        yield from self._mask_metadata(mask)
+
+    def _index(self, id_: int, item: Item) -> None:
+        for name, key in self._keys(item):
+            self.indexes.setdefault(name, {}).setdefault(key, set()).add(id_)
+
+    def _unindex(self, id_: int, item: Item) -> None:
+        for name, key in self._keys(item):
+            ids = self.indexes[name][key]
+            ids.discard(id_)
+            if not ids:
+                del self.indexes[name][key]
+
+    def put(self, id_: int, item: Item | None) -> Item | None:
+        if (previous := self.items.get(id_)) is not None:
+            self._unindex(id_, previous)
+        if item is None:
+            self.items.pop(id_, None)
+        else:
+            self.items[id_] = item
+            self._index(id_, item)
+        return previous
+
+    def _candidates(self, mask: Query.Mask) -> typing.Iterable[int]:
+        sets = [
+            self.indexes.get(name, {}).get(key, set())
+            for name, key in self._mask_keys(mask)
+        ]
+        if not sets:
+            return (*self.items,)
+        return sorted(functools.reduce(set.intersection, sorted(sets, key=len)))
+
+    def _after(self, query: Query, cursor: Query.Order.Cursor) -> bool:
+        if (query.after is None) or (query.order is None):
+            return True
+        sortable = Query.Order.sortable
+        if query.order.descending:
+            return sortable(cursor) < sortable(query.after)
+        return sortable(cursor) > sortable(query.after)
+
+    def _ordered(self, query: Query, ids: typing.Iterable[int]) -> typing.Iterable[int]:
+        if query.order is None:
+            return ids
+        keyed = sorted(
+            ((query.order.cursor(self.items[i]), i) for i in ids),
+            key=lambda k: Query.Order.sortable(k[0]),
+            reverse=query.order.descending,
+        )
+        return (i for cursor, i in keyed if self._after(query, cursor))
+
+    def find(self, query: Query) -> typing.Sequence[int]:
+        return (
+            *itertools.islice(
+                self._ordered(
+                    query,
+                    (
+                        i
+                        for i in self._candidates(query.mask)
+                        if self.Match(mask=query.mask, item=self.items[i])
+                    ),
+                ),
+                query.limit,
+            ),
+        )
+
+    def exact(self, item: Item) -> int:
+        for i in self._candidates(
+            Query.Mask(
+                kind=item.kind,
+                status=item.status,
+                chain=item.chain,
+                reserver=item.reserver,
+            )
+        ):
+            if self.items[i] == item:
+                return i
+        raise KeyError(item)
@@ -0,0 +1,3 @@
+from .Memory import Memory as Memory
+
+__all__ = ["Memory"]
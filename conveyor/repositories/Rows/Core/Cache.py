@@ -1,4 +1,5 @@
 from . import Enums
+from .Schema import Schema
 
 
 class Cache(dict[str, Enums.Cache]):
@@ -9,3 +10,13 @@ class Cache(dict[str, Enums.Cache]):
 
 
 cache = Cache()
+
+
+class Schemas(dict[str, Schema]):
+    def __getitem__(self, __key: str) -> Schema:
+        if __key not in self:
+            self[__key] = Schema()
+        return super().__getitem__(__key)
+
+
+schemas = Schemas()
@@ -0,0 +1,73 @@
+import base64
+import typing
+import binascii
+import datetime
+
+from ....core import Item
+from ....core.Item.Digest import default_algorithm
+
+epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+microsecond = datetime.timedelta(microseconds=1)
+
+raw = b"\x00"
+text = b"\x01"
+
+
+def _decoded(value: str) -> bytes | None:
+    try:
+        result = base64.b64decode(value.encode("ascii"), validate=True)
+    except (binascii.Error, UnicodeEncodeError):
+        return None
+    if base64.b64encode(result).decode("ascii") != value:
+        return None
+    return result
+
+
+def pack(value: str | None) -> bytes | None:
+    if value is None:
+        return None
+    if (decoded := _decoded(value)) is not None:
+        return raw + decoded
+    return text + value.encode("utf-8")
+
+
+def unpack(value: bytes | None) -> str | None:
+    if value is None:
+        return None
+    if value[:1] == raw:
+        return base64.b64encode(value[1:]).decode("ascii")
+    return value[1:].decode("utf-8")
+
+
+def digest(value: Item.Data.Digest) -> bytes:
+    if value.algorithm == default_algorithm:
+        return raw + value.value
+    return text + value.string.encode("ascii")
+
+
+def undigest(value: bytes) -> Item.Data.Digest:
+    if value[:1] == raw:
+        return Item.Data.Digest(value[1:])
+    return Item.Data.Digest.from_base64(value[1:].decode("ascii"))
+
+
+def timestamp(value: datetime.datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.UTC)
+    return (value - epoch) // microsecond
+
+
+def moment(value: int) -> datetime.datetime:
+    return epoch + value * microsecond
+
+
+def encode(name: str, value: typing.Any) -> typing.Any:
+    match value:
+        case datetime.datetime() if name == "created":
+            return timestamp(value)
+        case str() if name in ("chain", "reserver"):
+            return pack(value)
+        case str() if name == "digest":
+            return digest(Item.Data.Digest.from_base64(value))
+        case _:
+            return value
@@ -0,0 +1,68 @@
+import typing
+import functools
+import itertools
+import sqlalchemy
+import dataclasses
+
+from ....core import Item, Query
+
+from .Enums import Enums
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Condition:
+    kind: Item.Kind
+    name: str
+    predicate: Query.Mask.Predicate
+    enums: Enums.Enums
+    encode: typing.Callable[[str, typing.Any], typing.Any]
+    enumerated: bool
+
+    def __iter__(self) -> typing.Iterator[sqlalchemy.ColumnElement[bool]]:
+        return itertools.chain(self.bounds, self.in_, self.not_, self.null)
+
+    @functools.cached_property
+    def enum(self) -> Enums.Enum | None:
+        if self.enumerated or any(
+            isinstance(v, Item.Metadata.Enumerable) for v in self.predicate.values
+        ):
+            return self.enums[(self.kind, Item.Key(self.name))]
+        return None
+
+    @property
+    def column(self) -> sqlalchemy.ColumnClause[typing.Any]:
+        if self.enum is None:
+            return sqlalchemy.column(self.name)
+        return sqlalchemy.column(self.enum.db_field)
+
+    def value(self, value: typing.Any) -> typing.Any:
+        if self.enum is None:
+            return self.encode(self.name, value)
+        return self.enum.convert(
+            Item.Metadata.Enumerable(Query.Mask.Predicate.described(value))
+        )
+
+    @property
+    def bounds(self):
+        if isinstance(self.predicate, Query.Mask.Range):
+            if self.enum is not None:
+                raise TypeError(f"Can not compare enumerable field `{self.name}`")
+            if self.predicate.lower is not None:
+                yield self.column >= self.value(self.predicate.lower)
+            if self.predicate.upper is not None:
+                yield self.column < self.value(self.predicate.upper)
+
+    @property
+    def in_(self):
+        if isinstance(self.predicate, Query.Mask.In):
+            yield self.column.in_([self.value(v) for v in self.predicate.options])
+
+    @property
+    def not_(self):
+        if isinstance(self.predicate, Query.Mask.Not):
+            yield self.column != self.value(self.predicate.value)
+
+    @property
+    def null(self):
+        if isinstance(self.predicate, Query.Mask.Null):
+            yield self.column.is_(None)
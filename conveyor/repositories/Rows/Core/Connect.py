@@ -1,5 +1,19 @@
 import typing
 import sqlalchemy
+import sqlalchemy.event
 
 
 Connect = typing.Callable[[], typing.ContextManager[sqlalchemy.Connection]]
+
+
+def begin(connection: sqlalchemy.Connection) -> None:
+    if (dbapi := connection.connection.dbapi_connection) is not None:
+        dbapi.isolation_level = None
+    connection.exec_driver_sql("BEGIN")
+
+
+def transactional(db: sqlalchemy.engine.Engine) -> None:
+    if (db.dialect.driver == "pysqlite") and not sqlalchemy.event.contains(
+        db, "begin", begin
+    ):
+        sqlalchemy.event.listen(db, "begin", begin)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import typing
-import datetime
+import collections
 import functools
 import itertools
 import contextlib
@@ -11,12 +11,20 @@ import sqlalchemy.exc
 
 from .Enums import Enums
 
-from ....core import Item, Query, Transforms
+from ....core import Item, Query, Changes, Transforms
 
 from . import Cache
 from .Row import Row
+from .Decoder import Decoder
+from . import Encoder
 from . import Fields
 from .Table import Table
+from . import Statement
+from .Schema import Schema
+from .Counters import Counters
+from .Condition import Condition
+from . import Compact
+from . import Connect
 from .DbEnumName import DbEnumName
 from .DbTableName import DbTableName
 
@@ -24,6 +32,7 @@ from .DbTableName import DbTableName
 @dataclasses.dataclass(frozen=True, kw_only=False)
 class Core:
     Item = Row
+    Counters = Counters
 
     db: sqlalchemy.engine.Engine
     connection: sqlalchemy.Connection | None = None
@@ -31,6 +40,15 @@ class Core:
     table: Transforms.Safe[Item.Kind, str] = DbTableName("conveyor")
     enum: Transforms.Safe[Item.Key, str] = DbEnumName("enum")
 
+    counters: Counters | None = None
+    chunk: int = 1024
+    compact: bool = False
+
+    def __post_init__(self):
+        if self.chunk < 1:
+            raise ValueError("`chunk` must be positive")
+        Connect.transactional(self.db)
+
     @property
     def _cache_id(self) -> str:
         return str(self.db)
@@ -39,6 +57,14 @@ class Core:
     def _cache(self) -> Cache.Enums.Cache:
         return Cache.cache[self._cache_id]
 
+    def _encode(self, name: str, value: typing.Any) -> typing.Any:
+        return Compact.encode(name, value) if self.compact else value
+
+    def _digest(self, value: typing.Any) -> Item.Data.Digest:
+        if self.compact:
+            return Compact.undigest(value)
+        return Item.Data.Digest.from_base64(value)
+
     @property
     def _enums(self) -> Enums.Enums:
         return Enums.Enums(
@@ -55,7 +81,12 @@ class Core:
 
         def __iter__(self):
             return itertools.chain(
-                self.status, self.chain, self.created, self.reserver, self.metadata
+                self.status,
+                self.chain,
+                self.created,
+                self.reserver,
+                self.metadata,
+                self.predicates,
             )
 
         @property
@@ -71,19 +102,22 @@ class Core:
                 case None:
                     """"""
                 case str():
-                    yield sqlalchemy.column("chain") == self.ref.chain
+                    yield self.eq("chain", self.ref.chain)
                 case _:
-                    yield sqlalchemy.column("chain") == self.ref.chain.value
+                    yield self.eq("chain", self.ref.chain.value)
 
         @property
         def created(self):
             if self.ref.created is not None:
-                yield sqlalchemy.column("created") == self.ref.created.value
+                yield self.eq("created", self.ref.created.value)
 
         @property
         def reserver(self):
             if self.ref.reserver is not None:
-                yield sqlalchemy.column("reserver") == self.ref.reserver.value
+                yield self.eq("reserver", self.ref.reserver.value)
+
+        def eq(self, name: str, value: typing.Any) -> sqlalchemy.ColumnElement[bool]:
+            return sqlalchemy.column(name) == self.rows._encode(name, value)
 
         @property
         def metadata(self):
@@ -97,196 +131,606 @@ class Core:
                         case _:
                             yield sqlalchemy.column(k.value) == v
 
-    def _where_string(self, ref: Row | Query.Mask) -> str:
-        return " and ".join(
-            str(c.compile(bind=self.db, compile_kwargs={"literal_binds": True}))
-            for c in self.Where(ref=ref, rows=self)
+        @property
+        def predicates(self):
+            if isinstance(self.ref, Query.Mask):
+                for name, p in self.ref.predicates.items():
+                    yield from Condition(
+                        kind=self.ref.kind,
+                        name=name,
+                        predicate=p,
+                        enums=self.rows._enums,
+                        encode=self.rows._encode,
+                        enumerated=self.rows._enumerated(self.ref.kind, name),
+                    )
+
+    def _clause(
+        self, kind: Item.Kind, values: typing.Mapping[str, typing.Any] | None = None
+    ) -> sqlalchemy.TableClause:
+        return Statement.table(self.table(kind), Statement.shape(values or {}))
+
+    def _select(
+        self,
+        kind: Item.Kind,
+        where: typing.Iterable[sqlalchemy.ColumnElement[bool]],
+        *columns: sqlalchemy.ColumnElement[typing.Any],
+    ) -> sqlalchemy.Select:
+        return sqlalchemy.select(*columns).select_from(self._clause(kind)).where(*where)
+
+    def _where(
+        self, ref: Row | Query.Mask
+    ) -> tuple[sqlalchemy.ColumnElement[bool], ...]:
+        return (*self.Where(ref=ref, rows=self),)
+
+    def _enumerated(self, kind: Item.Kind, name: str) -> bool:
+        return (name == "status") or (self.enum(Item.Key(name)) in self._columns(kind))
+
+    def _sortable(
+        self, kind: Item.Kind, key: str
+    ) -> sqlalchemy.ColumnClause[typing.Any]:
+        if self._enumerated(kind, key):
+            raise TypeError(f"Can not order by enumerable field `{key}`")
+        return sqlalchemy.column(key)
+
+    def _cursor(
+        self, kind: Item.Kind, order: Query.Order, after: Query.Order.Cursor
+    ) -> sqlalchemy.ColumnElement[bool]:
+        return Statement.after(
+            [self._sortable(kind, k) for k in order.keys],
+            [self._encode(k, v) for k, v in zip(order.keys, after)],
+            descending=order.descending,
+        )
+
+    def _after(self, query: Query) -> typing.Iterable[sqlalchemy.ColumnElement[bool]]:
+        if (query.order is not None) and (query.after is not None):
+            yield self._cursor(query.mask.kind, query.order, query.after)
+
+    def _query_where(self, query: Query) -> tuple[sqlalchemy.ColumnElement[bool], ...]:
+        return (*self.Where(ref=query.mask, rows=self), *self._after(query))
+
+    def _order(self, query: Query) -> tuple[sqlalchemy.ColumnElement[typing.Any], ...]:
+        if query.order is None:
+            return ()
+        columns = (self._sortable(query.mask.kind, k) for k in query.order.keys)
+        return tuple(
+            Statement.sorted_(c, descending=query.order.descending) for c in columns
+        )
+
+    @property
+    def _schema(self) -> Schema:
+        return Cache.schemas[self._cache_id]
+
+    def _columns(self, kind: Item.Kind) -> frozenset[str]:
+        with self._connect() as connection:
+            return self._schema.columns(connection, self.table(kind)) or frozenset()
+
+    def _names(self, ref: Row | Query.Mask) -> typing.Iterable[str]:
+        yield from (k.value for k in (ref.metadata or {}))
+        if isinstance(ref, Query.Mask):
+            yield from ref.predicates
+
+    def _covers(self, kind: Item.Kind, names: tuple[str, ...]) -> bool:
+        existing = self._columns(kind)
+        return bool(existing) and all(
+            (n in existing) or (self.enum(Item.Key(n)) in existing) for n in names
         )
 
-    def _compile(self, v: Item.Value) -> str:
-        return str(
-            sqlalchemy.text(":v")
-            .bindparams(v=v)
-            .compile(bind=self.db, compile_kwargs={"literal_binds": True})
+    def _known(self, kind: Item.Kind, names: typing.Iterable[str]) -> bool:
+        names = (*names,)
+        if self._covers(kind, names):
+            return True
+        self._schema.forget(self.table(kind))
+        return self._covers(kind, names)
+
+    def _metadata_columns(
+        self, kind: Item.Kind, keys: typing.Iterable[Item.Metadata.Key]
+    ) -> typing.Iterable[str]:
+        existing = self._columns(kind)
+        for k in keys:
+            yield from (
+                name
+                for name in (k.value, self.enum(Item.Key(k.value)))
+                if name in existing
+            )
+
+    def _projected(
+        self, kind: Item.Kind, projection: Query.Projection
+    ) -> typing.Iterable[str]:
+        if "status" in projection:
+            yield self._enums[(kind, Item.Key("status"))].db_field
+        yield "digest"
+        yield from (f for f in ("chain", "created", "reserver") if f in projection)
+        yield from self._metadata_columns(kind, projection.metadata)
+
+    def _prepare(
+        self,
+        kind: Item.Kind,
+        columns: typing.Iterable[str],
+        fields: typing.Callable[[], typing.Iterable[Fields.Field]],
+    ) -> None:
+        name = self.table(kind)
+        with self._connect() as connection:
+            if self._schema.missing(connection, name, columns):
+                Table(connection=connection, name=name, fields=fields())
+                self._schema.remember(name, columns)
+
+    def _create(self, row: Row, columns: typing.Iterable[str]) -> None:
+        self._prepare(
+            row.kind,
+            columns,
+            lambda: Fields.Fields(
+                row=row,
+                db=self.db,
+                table=row.kind,
+                transform=self.table,
+                enums=self._enums,
+                compact=self.compact,
+            ).fields,
         )
 
-    def _values(self, d: dict[str, Item.Value]) -> str:
-        keys = ", ".join(d)
-        values = ", ".join(self._compile(v) for v in d.values())
-        return f"({keys}) values ({values})"
+    def _written(
+        self,
+        kind: Item.Kind,
+        prepare: typing.Callable[[], None],
+        statement: sqlalchemy.Executable,
+        values: list[dict[str, Item.Value]] | None = None,
+    ) -> sqlalchemy.CursorResult[typing.Any]:
+        prepare()
+        try:
+            with self._connect() as connection:
+                return connection.execute(statement, values)
+        except sqlalchemy.exc.DBAPIError:
+            self._schema.forget(self.table(kind))
+            prepare()
+            with self._connect() as connection:
+                return connection.execute(statement, values)
 
-    def _set(self, d: dict[str, Item.Value]) -> str:
-        return ", ".join(f"{k} = {self._compile(v)}" for k, v in d.items())
+    @contextlib.contextmanager
+    def _counting(self) -> typing.Iterator[typing.Self]:
+        if self.counters is None:
+            yield self
+        else:
+            with self.transaction() as t:
+                yield t
+
+    def _counted(self, deltas: Counters.Deltas) -> None:
+        if self.counters is not None:
+            with self._connect() as connection:
+                if self._schema.columns(connection, self.counters.name) is None:
+                    self.counters.create(connection)
+                self.counters.add(connection, deltas)
+
+    def _statuses(self, mask: Query.Mask) -> dict[Item.Status, int]:
+        if self.counters is None:
+            return {}
+        enum = self._enums[(mask.kind, Item.Key("status"))]
+        statement = self._select(
+            mask.kind, self._where(mask), enum.column, sqlalchemy.func.count()
+        ).group_by(enum.column)
+        try:
+            with self._connect() as connection:
+                counts = (*connection.execute(statement),)
+        except Exception:
+            return {}
+        return {
+            Item.Status(typing.cast(str, enum.convert(s).value)): n for s, n in counts
+        }
+
+    def _moved(
+        self, kind: Item.Kind, statuses: dict[Item.Status, int], to: Item.Status | None
+    ) -> Counters.Deltas:
+        result: Counters.Deltas = collections.Counter()
+        for status, n in statuses.items():
+            result[(kind, status)] -= n
+            if to is not None:
+                result[(kind, to)] += n
+        return result
 
     def append(self, row: Row) -> None:
-        name = self.table(row.kind)
+        with self._counting() as t:
+            t._append(row)
+            t._counted({(row.kind, row.status): 1})
+
+    def _encoder(self, row: Row) -> Encoder.Encoder:
+        return Encoder.encoder(
+            self._cache_id,
+            self.enum,
+            row.kind,
+            Encoder.signature(row),
+            compact=self.compact,
+        )
 
-        created = False
-        for _ in range(5):
-            try:
-                with self._connect() as connection:
-                    connection.execute(
-                        sqlalchemy.text(
-                            f"insert into {name} "
-                            f"{self._values(row.Dict(row=row, enums=self._enums)())}"
-                        )
-                    )
-                break
-            except Exception:
-                if not created:
-                    with self._connect() as connection:
-                        Table(
-                            connection=connection,
-                            name=name,
-                            fields=Fields.Fields(
-                                row=row,
-                                db=self.db,
-                                table=row.kind,
-                                transform=self.table,
-                                enums=self._enums,
-                            ).fields,
-                        )
-                created = True
+    def _append(self, row: Row) -> None:
+        self._resolve((row,))
+        self._insert_many(row, [self._encoder(row).values(row)])
+
+    def _insert_many(self, row: Row, values: list[dict[str, Item.Value]]) -> None:
+        self._written(
+            row.kind,
+            lambda: self._create(row, values[0]),
+            sqlalchemy.insert(self._clause(row.kind, values[0])),
+            values,
+        )
+
+    def _enumerables(
+        self, row: Row
+    ) -> typing.Iterable[tuple[tuple[Item.Kind, Item.Key], Item.Metadata.Enumerable]]:
+        yield (
+            (row.kind, Item.Key("status")),
+            Item.Metadata.Enumerable(row.status.value),
+        )
+        for key, value in row.metadata.items():
+            if isinstance(value, Item.Metadata.Enumerable) and isinstance(
+                value.value, str
+            ):
+                yield ((row.kind, Item.Key(key.value)), value)
+
+    def _resolve(self, rows: typing.Iterable[Row]) -> None:
+        wanted: dict[tuple[Item.Kind, Item.Key], set[Item.Metadata.Enumerable]] = (
+            collections.defaultdict(set)
+        )
+        for row in rows:
+            for field, value in self._enumerables(row):
+                wanted[field].add(value)
+        for field, descriptions in wanted.items():
+            self._enums[field].integer.many(descriptions)
+
+    def append_many(self, rows: typing.Iterable[Row]) -> None:
+        groups: dict[tuple[Item.Kind, tuple[str, ...]], tuple[Row, list]] = {}
+        deltas: Counters.Deltas = collections.Counter()
+
+        rows = (*rows,)
+        self._resolve(rows)
+        for row in rows:
+            encoder = self._encoder(row)
+            key = (row.kind, encoder.columns)
+            groups.setdefault(key, (row, []))[1].append(encoder.values(row))
+            deltas[(row.kind, row.status)] += 1
+
+        with self._counting() as t:
+            for row, values in groups.values():
+                t._insert_many(row, values)
+            t._counted(deltas)
 
     @dataclasses.dataclass(frozen=True, kw_only=True)
     class Get:
         rows: Core
         query: Query
 
-        def __str__(self):
-            q = f"select * from {self.rows.table(self.query.mask.kind)}"
-            if where := self.rows._where_string(self.query.mask):
-                q = f"{q} where {where}"
+        def select(self, names: typing.Iterable[str]) -> sqlalchemy.Select:
+            statement = self.rows._select(
+                self.query.mask.kind,
+                self.rows._query_where(self.query),
+                *Statement.columns(names),
+            ).order_by(*self.rows._order(self.query))
             if self.query.limit is not None:
-                q = f"{q} limit {self.query.limit}"
-            return q
+                statement = statement.limit(self.query.limit)
+            return statement
 
         @functools.cached_property
-        def raw(self):
+        def names(self) -> tuple[str, ...]:
+            if self.query.projection is None:
+                return ("*",)
+            return (*self.rows._projected(self.query.mask.kind, self.query.projection),)
+
+        def reserve(
+            self, reserver: Item.Reserver, connection: sqlalchemy.Connection
+        ) -> sqlalchemy.Update:
+            match connection.dialect.name:
+                case "sqlite":
+                    key, candidates = "rowid", self.select(("rowid",))
+                case "postgresql":
+                    key, candidates = "ctid", self.select(("ctid",)).with_for_update(
+                        skip_locked=True
+                    )
+                case _:
+                    raise NotImplementedError(
+                        f"Batch reservation is not supported for dialect "
+                        f"`{connection.dialect.name}`"
+                    )
+
+            table = self.rows._clause(self.query.mask.kind, {"reserver": None})
+            return (
+                sqlalchemy.update(table)
+                .values(reserver=self.rows._encode("reserver", reserver.value))
+                .where(sqlalchemy.literal_column(key).in_(candidates))
+                .returning(*Statement.columns(self.names))
+            )
+
+        def __iter__(self) -> typing.Iterator[sqlalchemy.Row[typing.Any]]:
+            if self.rows.db.dialect.name == "sqlite":
+                return self.paged
+            return self.streamed
+
+        @property
+        def streamed(self) -> typing.Iterator[sqlalchemy.Row[typing.Any]]:
             with self.rows._connect() as connection:
-                return (*connection.execute(sqlalchemy.text(str(self))),)
+                if connection.dialect.supports_server_side_cursors:
+                    connection = connection.execution_options(
+                        stream_results=True, yield_per=self.rows.chunk
+                    )
+                yield from connection.execute(self.select(self.names))
 
-        def status_enum(self, r: sqlalchemy.Row[typing.Any]):
+        @functools.cached_property
+        def paging(self) -> Query.Order:
+            if self.query.order is None:
+                return Query.Order(("rowid",))
+            return Query.Order(
+                (*self.query.order.keys, "rowid"),
+                descending=self.query.order.descending,
+            )
+
+        @functools.cached_property
+        def paged_names(self) -> tuple[str, ...]:
+            if self.query.projection is None:
+                return ("*", "rowid")
+            return (
+                *self.names,
+                *(k for k in self.paging.keys if k not in self.names),
+            )
+
+        @property
+        def first(self) -> Query.Order.Cursor | None:
+            if self.query.after is None:
+                return None
+            return (*self.query.after, -1 if self.paging.descending else 2**63 - 1)
+
+        def page(
+            self, after: Query.Order.Cursor | None, limit: int
+        ) -> tuple[sqlalchemy.Row[typing.Any], ...]:
+            get = Core.Get(
+                rows=self.rows,
+                query=dataclasses.replace(
+                    self.query, order=self.paging, after=after, limit=limit
+                ),
+            )
+            with self.rows._connect() as connection:
+                return (*connection.execute(get.select(self.paged_names)),)
+
+        def limit(self, remaining: Query.Limit) -> int:
+            if remaining is None:
+                return self.rows.chunk
+            return min(self.rows.chunk, remaining)
+
+        @property
+        def paged(self) -> typing.Iterator[sqlalchemy.Row[typing.Any]]:
+            after, remaining = self.first, self.query.limit
+            while True:
+                page = self.page(after, limit := self.limit(remaining))
+                yield from page
+                if (len(page) < limit) or (len(page) == remaining):
+                    return
+                after = tuple(getattr(page[-1], k) for k in self.paging.keys)
+                if remaining is not None:
+                    remaining -= len(page)
+
+        @property
+        def status_enum(self) -> Enums.Enum:
             return self.rows._enums[(self.query.mask.kind, Item.Key("status"))]
 
-        def status(self, r: sqlalchemy.Row[typing.Any]):
-            enum = self.status_enum(r)
-            if (result := enum.string(getattr(r, enum.db_field)).value) is None:
-                raise TypeError("Status value can not be None")
-            return Item.Status(result)
-
-        @dataclasses.dataclass(frozen=True, kw_only=True)
-        class Metadata:
-            source: Core.Get
-            row: sqlalchemy.Row[typing.Any]
-
-            def _base_field(self, name: str):
-                return name in (f.name for f in dataclasses.fields(Item))
-
-            def _base_inner_field(self, name: str):
-                return name in ("digest", self.source.status_enum(self.row).db_field)
-
-            def _key(self, name: str):
-                return not (self._base_field(name) or self._base_inner_field(name))
-
-            @functools.cached_property
-            def _names(self):
-                return (
-                    name
-                    for name in self.row.__getstate__()["_parent"].__getstate__()[
-                        "_keys"
-                    ]
-                    if self._key(name)
-                )
+        @property
+        def converters(self) -> dict[str, tuple[str, Decoder.Convert]]:
+            status = self.status_enum
+            layout = Decoder.layouts[self.rows.compact]
+            return {
+                status.db_field: (
+                    "status",
+                    Decoder.Status(string=status.string.transform),
+                ),
+                **{
+                    name: (name, layout[name])
+                    for name in ("chain", "created", "reserver")
+                },
+            }
+
+        def metadata(
+            self, name: str, interned: Decoder.Interned
+        ) -> tuple[Item.Metadata.Key, Decoder.Convert]:
+            if not (~self.rows.enum).valid(name):
+                return Item.Metadata.Key(name), interned
+            unenumed = (~self.rows.enum)(name)
+            enum = self.rows._enums[(self.query.mask.kind, unenumed)]
+            return Item.Metadata.Key(unenumed.value), Decoder.Enumerated(
+                kind=self.query.mask.kind, column=name, string=enum.string.transform
+            )
 
-            def _enum(self, name: str):
-                if not isinstance(value := getattr(self.row, name), int | None):
-                    raise TypeError(
-                        f"Expected column `{name}` "
-                        f"in table `{self.source.query.mask.kind.value}` "
-                        "to hold enumerable using integer or null value"
-                    )
-                unenumed = (~self.source.rows.enum)(name)
-                enum_id = (self.source.query.mask.kind, unenumed)
-                return Item.Metadata.Key(unenumed.value), self.source.rows._enums[
-                    enum_id
-                ].convert(value)
-
-            def _not_enum(self, name: str):
-                return Item.Metadata.Key(name), getattr(self.row, name)
-
-            def __call__(self):
-                result: Item.Metadata.Mutable = {}
-                for name in self._names:
-                    if (~self.source.rows.enum).valid(name):
-                        key, value = self._enum(name)
-                    else:
-                        key, value = self._not_enum(name)
-                    result[key] = value
-                return Item.Metadata(result)
+        def decoder(self, fields: typing.Sequence[str]) -> Decoder:
+            converters = self.converters
+            base = (
+                *(
+                    (*converters[f], i)
+                    for i, f in enumerate(fields)
+                    if (f in converters) and self.query.requests(converters[f][0])
+                ),
+            )
+            skipped = {"digest", "rowid", *(f.name for f in dataclasses.fields(Item))}
+            interned = Decoder.Interned()
+            return Decoder(
+                kind=self.query.mask.kind,
+                digest=fields.index("digest"),
+                digests=Decoder.layouts[self.rows.compact]["digest"],
+                base=base,
+                missing={
+                    name: None
+                    for name in ("status", "chain", "created", "reserver")
+                    if name not in {b[0] for b in base}
+                },
+                metadata=(
+                    *(
+                        (*self.metadata(f, interned), i)
+                        for i, f in enumerate(fields)
+                        if (f not in converters) and (f not in skipped)
+                    ),
+                ),
+            )
+
+    def _rows(
+        self, get: Core.Get, raw: typing.Iterable[sqlalchemy.Row[typing.Any]]
+    ) -> typing.Iterable[Row]:
+        iterator = iter(raw)
+        if (first := next(iterator, None)) is None:
+            return
+        decoder = get.decoder(first._fields)
+        yield decoder(first)
+        yield from map(decoder, iterator)
 
     def __getitem__(self, query: Query) -> typing.Iterable[Row]:
         get = self.Get(rows=self, query=query)
-        return (
-            Row(
-                kind=query.mask.kind,
-                status=get.status(r),
-                chain=r.chain,
-                created=Item.Created(
-                    datetime.datetime.fromisoformat(r.created).replace(
-                        tzinfo=datetime.UTC
-                    )
-                ),
-                reserver=Item.Reserver(r.reserver)
-                if bool(r.reserver)
-                else Item.Reserver(None),
-                digest=Item.Data.Digest.from_base64(r.digest),
-                metadata=get.Metadata(source=get, row=r)(),
-            )
-            for r in get.raw
-        )
+        return self._rows(get, get)
+
+    def reserve(self, query: Query, reserver: Item.Reserver) -> typing.Iterable[Row]:
+        get = self.Get(rows=self, query=query)
+        with self._connect() as connection:
+            raw = (*connection.execute(get.reserve(reserver, connection)),)
+        return self._rows(get, raw)
 
     def __setitem__(self, old: Row, new: Row) -> None:
-        if not (changes := new.sub(old, self._enums)):
+        self._resolve((new,))
+        if not (changes := self._encoder(new).diff(old, new)):
             return
 
-        name = self.table(old.kind)
+        with self._counting() as t:
+            updated = t._update(old, new, changes)
+            if old.status != new.status:
+                t._counted(
+                    {(old.kind, old.status): -updated, (old.kind, new.status): updated}
+                )
 
-        for _ in range(2):
-            try:
-                with self._connect() as connection:
-                    connection.execute(
-                        sqlalchemy.text(
-                            f"update {name} set {self._set(changes)} "
-                            f"where {self._where_string(old)}"
+    def _update(self, old: Row, new: Row, changes: dict[str, Item.Value]) -> int:
+        statement = (
+            sqlalchemy.update(self._clause(old.kind, changes))
+            .values(changes)
+            .where(*self._where(old))
+        )
+        if not self._known(old.kind, self._names(old)):
+            return 0
+        return self._written(
+            old.kind, lambda: self._create(new, changes), statement
+        ).rowcount
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Set:
+        kind: Item.Kind
+        changes: Changes
+        rows: Core
+
+        def __call__(self):
+            return dict[str, Item.Value]({key: value for key, value in self})
+
+        def __iter__(self):
+            return itertools.chain(self.status, self.metadata)
+
+        @property
+        def status(self):
+            if self.changes.status is not None:
+                status = self.rows._enums[(self.kind, Item.Key("status"))]
+                yield (status.db_field, status.integer(self.changes.status))
+
+        @property
+        def metadata(self):
+            if self.changes.metadata is not None:
+                for key, value in self.changes.metadata.items():
+                    if key.value in Row.reserved():
+                        raise TypeError(
+                            f"Metadata field `{key.value}` collides with "
+                            f"reserved fields {sorted(Row.reserved())}"
                         )
-                    )
-                break
-            except Exception:
-                with self._connect() as connection:
-                    Table(
-                        connection=connection,
-                        name=name,
-                        fields=Fields.Fields(
-                            row=new,
-                            db=self.db,
-                            table=old.kind,
-                            transform=self.table,
-                            enums=self._enums,
-                        ).fields,
-                    )
+                    match value:
+                        case Item.Metadata.Enumerable():
+                            e = self.rows._enums[(self.kind, Item.Key(key.value))]
+                            yield (e.db_field, e.convert(value))
+                        case _:
+                            yield (key.value, value)
+
+    def _extend(
+        self,
+        kind: Item.Kind,
+        metadata: Item.Metadata | None,
+        columns: typing.Iterable[str],
+    ) -> None:
+        self._prepare(
+            kind,
+            columns,
+            lambda: (
+                Fields.Field(
+                    name=Item.Key(k.value),
+                    value=v,
+                    table=kind,
+                    enums=self._enums,
+                    transform=self.table,
+                )
+                for k, v in (metadata or {}).items()
+            ),
+        )
+
+    def update_where(self, mask: Query.Mask, changes: Changes) -> int:
+        if not (values := self.Set(kind=mask.kind, changes=changes, rows=self)()):
+            return 0
+
+        statement = (
+            sqlalchemy.update(self._clause(mask.kind, values))
+            .values(values)
+            .where(*self._where(mask))
+        )
+
+        with self._counting() as t:
+            statuses = t._statuses(mask) if changes.status is not None else {}
+            updated = t._update_where(mask, changes, values, statement)
+            t._counted(t._moved(mask.kind, statuses, changes.status))
+            return updated
+
+    def _update_where(
+        self,
+        mask: Query.Mask,
+        changes: Changes,
+        values: dict[str, Item.Value],
+        statement: sqlalchemy.Update,
+    ) -> int:
+        if not self._known(mask.kind, self._names(mask)):
+            return 0
+        return self._written(
+            mask.kind,
+            lambda: self._extend(mask.kind, changes.metadata, values),
+            statement,
+        ).rowcount
+
+    def delete_where(self, mask: Query.Mask) -> typing.Sequence[Item.Data.Digest]:
+        if not self.db.dialect.delete_returning:
+            raise NotImplementedError(
+                f"Deletion by mask is not supported "
+                f"for dialect `{self.db.dialect.name}`"
+            )
+
+        with self._counting() as t:
+            statuses = t._statuses(mask)
+            deleted = t._delete_where(mask)
+            t._counted(t._moved(mask.kind, statuses, None))
+            return deleted
+
+    def _delete_where(self, mask: Query.Mask) -> typing.Sequence[Item.Data.Digest]:
+        statement = (
+            sqlalchemy.delete(self._clause(mask.kind))
+            .where(*self._where(mask))
+            .returning(sqlalchemy.literal_column("digest"))
+        )
+        if not self._known(mask.kind, self._names(mask)):
+            return ()
+        with self._connect() as connection:
+            deleted = connection.execute(statement).scalars()
+            return (*(self._digest(d) for d in deleted),)
 
     def __delitem__(self, row: Row) -> None:
+        with self._counting() as t:
+            t._counted({(row.kind, row.status): -t._delete(row)})
+
+    def _delete(self, row: Row) -> int:
         try:
             with self._connect() as connection:
-                connection.execute(
-                    sqlalchemy.text(
-                        f"delete from {self.table(row.kind)} "
-                        f"where {self._where_string(row)}"
-                    )
-                )
+                return connection.execute(
+                    sqlalchemy.delete(self._clause(row.kind)).where(*self._where(row))
+                ).rowcount
         except Exception:
-            """"""
+            return 0
 
     @contextlib.contextmanager
     def transaction(self) -> typing.Iterator[typing.Self]:
@@ -311,14 +755,46 @@ class Core:
         with self._connect() as connection:
             try:
                 return connection.execute(
-                    sqlalchemy.text(
-                        f"select (exists (select * from {self.table(row.kind)} "
-                        f"where {self._where_string(row)}))"
+                    sqlalchemy.select(
+                        sqlalchemy.exists()
+                        .select_from(self._clause(row.kind))
+                        .where(*self._where(row))
                     )
                 ).scalar_one()
             except Exception:
                 return False
 
+    def _countable(self, mask: Query.Mask) -> bool:
+        return (not mask.predicates) and all(
+            getattr(mask, name) is None
+            for name in ("data", "metadata", "chain", "created", "reserver")
+        )
+
+    def count(self, mask: Query.Mask) -> int:
+        where = self._where(mask)
+        with self._connect() as connection:
+            if (self.counters is not None) and self._countable(mask):
+                return self.counters.get(connection, mask.kind, mask.status)
+            try:
+                with connection.begin_nested():
+                    return connection.execute(
+                        self._select(mask.kind, where, sqlalchemy.func.count())
+                    ).scalar_one()
+            except Exception:
+                return 0
+
+    def recount(self) -> None:
+        if self.counters is None:
+            return
+        with self.transaction() as t, t._connect() as connection:
+            self.counters.clear(connection)
+            self._schema.forget(self.counters.name)
+            for name in sqlalchemy.inspect(connection).get_table_names():
+                if (~self.table).valid(name):
+                    kind = (~self.table)(name)
+                    statuses = t._statuses(Query.Mask(kind=kind))
+                    t._counted({(kind, s): n for s, n in statuses.items()})
+
     def __len__(self) -> int:
         with self._connect() as connection:
             return sum(
@@ -329,9 +805,20 @@ class Core:
                 if (~self.table).valid(name)
             )
 
+    def preload(self) -> None:
+        with self._connect() as connection:
+            for name in sqlalchemy.inspect(connection).get_table_names():
+                if name.startswith(f"{Enums.prefix}_"):
+                    self._cache.fetch(name, connection)
+                elif (~self.table).valid(name):
+                    self._schema.columns(connection, name)
+
     def clear(self) -> None:
         self._cache.clear()
+        self._schema.forget()
         with self._connect() as connection:
+            if self.counters is not None:
+                self.counters.clear(connection)
             for name in sqlalchemy.inspect(connection).get_table_names():
                 if (~self.table).valid(name):
                     connection.execute(sqlalchemy.text(f"DROP TABLE {name}"))
@@ -0,0 +1,73 @@
+import sqlalchemy
+import dataclasses
+import sqlalchemy.exc
+
+from ....core import Item
+
+Deltas = dict[tuple[Item.Kind, Item.Status], int]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=False)
+class Counters:
+    Deltas = Deltas
+
+    name: str = "_conveyor_counters"
+
+    @property
+    def table(self) -> sqlalchemy.Table:
+        return sqlalchemy.Table(
+            self.name,
+            sqlalchemy.MetaData(),
+            sqlalchemy.Column("kind", sqlalchemy.String(255), primary_key=True),
+            sqlalchemy.Column("status", sqlalchemy.String(255), primary_key=True),
+            sqlalchemy.Column("count", sqlalchemy.Integer(), nullable=False),
+        )
+
+    def create(self, connection: sqlalchemy.Connection) -> None:
+        self.table.create(bind=connection, checkfirst=True)
+
+    def add(self, connection: sqlalchemy.Connection, deltas: Deltas) -> None:
+        values = [
+            {"kind": kind.value, "status": status.value, "count": count}
+            for (kind, status), count in deltas.items()
+            if count
+        ]
+        if not values:
+            return
+
+        statement = sqlalchemy.text(
+            f"insert into {self.name} (kind, status, count) "
+            "values (:kind, :status, :count) "
+            "on conflict (kind, status) do update "
+            f"set count = {self.name}.count + excluded.count"
+        )
+        try:
+            with connection.begin_nested():
+                connection.execute(statement, values)
+        except sqlalchemy.exc.DBAPIError:
+            self.create(connection)
+            connection.execute(statement, values)
+
+    def get(
+        self,
+        connection: sqlalchemy.Connection,
+        kind: Item.Kind,
+        status: Item.Status | None,
+    ) -> int:
+        statement = (
+            f"select coalesce(sum(count), 0) from {self.name} where kind = :kind"
+        )
+        binds: dict[str, str] = {"kind": kind.value}
+        if status is not None:
+            statement = f"{statement} and status = :status"
+            binds["status"] = status.value
+        try:
+            with connection.begin_nested():
+                return connection.execute(
+                    sqlalchemy.text(statement), binds
+                ).scalar_one()
+        except sqlalchemy.exc.DBAPIError:
+            return 0
+
+    def clear(self, connection: sqlalchemy.Connection) -> None:
+        self.table.drop(bind=connection, checkfirst=True)
@@ -0,0 +1,118 @@
+import typing
+import datetime
+import dataclasses
+
+from ....core import Item
+
+from .Row import Row
+from . import Compact
+
+Convert = typing.Callable[[typing.Any], typing.Any]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Status:
+    string: Convert
+    statuses: dict[int, Item.Status] = dataclasses.field(default_factory=dict)
+
+    def __call__(self, value: int) -> Item.Status:
+        if (result := self.statuses.get(value)) is None:
+            if (description := self.string(value).value) is None:
+                raise TypeError("Status value can not be None")
+            result = self.statuses[value] = Item.Status(description)
+        return result
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Enumerated:
+    kind: Item.Kind
+    column: str
+    string: Convert
+
+    def __call__(self, value: int | None) -> Item.Metadata.Enumerable:
+        match value:
+            case None:
+                return Item.Metadata.Enumerable(None)
+            case int():
+                return self.string(value)
+        raise TypeError(
+            f"Expected column `{self.column}` "
+            f"in table `{self.kind.value}` "
+            "to hold enumerable using integer or null value"
+        )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Interned:
+    strings: dict[str, str] = dataclasses.field(default_factory=dict)
+
+    def __call__(self, value: typing.Any) -> typing.Any:
+        if isinstance(value, str):
+            return self.strings.setdefault(value, value)
+        return value
+
+
+def chain(value: str) -> str:
+    return value
+
+
+def created(value: str) -> Item.Created:
+    return Item.Created.trusted(
+        datetime.datetime.fromisoformat(value).replace(tzinfo=datetime.UTC)
+    )
+
+
+def reserver(value: str | None) -> Item.Reserver:
+    return Item.Reserver(value) if bool(value) else Item.Reserver(None)
+
+
+def moment(value: int) -> Item.Created:
+    return Item.Created.trusted(Compact.moment(value))
+
+
+def unpacked(value: bytes | None) -> Item.Reserver:
+    return reserver(Compact.unpack(value))
+
+
+layouts: dict[bool, dict[str, Convert]] = {
+    False: {
+        "digest": Item.Data.Digest.from_base64,
+        "chain": chain,
+        "created": created,
+        "reserver": reserver,
+    },
+    True: {
+        "digest": Compact.undigest,
+        "chain": Compact.unpack,
+        "created": moment,
+        "reserver": unpacked,
+    },
+}
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Decoder:
+    Convert = Convert
+    Status = Status
+    Enumerated = Enumerated
+    Interned = Interned
+
+    layouts = layouts
+
+    kind: Item.Kind
+    digest: int
+    digests: Convert
+    base: tuple[tuple[str, Convert, int], ...]
+    missing: dict[str, None]
+    metadata: tuple[tuple[Item.Metadata.Key, Convert, int], ...]
+
+    def __call__(self, r: typing.Sequence[typing.Any]) -> Row:
+        return Row.trusted(
+            kind=self.kind,
+            digest=self.digests(r[self.digest]),
+            metadata=Item.Metadata(
+                {key: convert(r[i]) for key, convert, i in self.metadata}
+            ),
+            **{name: convert(r[i]) for name, convert, i in self.base},
+            **self.missing,
+        )
@@ -0,0 +1,154 @@
+import typing
+import functools
+import dataclasses
+
+from ....core import Item, Transforms
+
+from . import Cache
+from . import Compact
+from .Row import Row
+from .Enums import Enums
+
+Convert = typing.Callable[[typing.Any], typing.Any]
+Signature = tuple[tuple[Item.Metadata.Key, bool], ...]
+
+absent = object()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Enumerated:
+    cache_id: str
+    table: str
+
+    def __call__(self, value: Item.Metadata.Enumerable | Item.Status) -> int | None:
+        if value.value is None:
+            return None
+        return Cache.cache[self.cache_id][self.table].value[
+            Item.Metadata.Enumerable(value.value)
+        ]
+
+
+def same(value: Item.Value) -> Item.Value:
+    return value
+
+
+def digest(value: Item.Data.Digest) -> str:
+    return value.string
+
+
+def created(value: Item.Created) -> Item.Value:
+    return value.value
+
+
+def reserver(value: Item.Reserver) -> str | None:
+    return value.value
+
+
+def timestamp(value: Item.Created) -> int:
+    return Compact.timestamp(value.value)
+
+
+def packed(value: Item.Reserver) -> bytes | None:
+    return Compact.pack(value.value)
+
+
+layouts: dict[bool, tuple[tuple[str, Convert], ...]] = {
+    False: (
+        ("chain", same),
+        ("digest", digest),
+        ("created", created),
+        ("reserver", reserver),
+    ),
+    True: (
+        ("chain", Compact.pack),
+        ("digest", Compact.digest),
+        ("created", timestamp),
+        ("reserver", packed),
+    ),
+}
+
+
+def signature(row: Row) -> Signature:
+    return tuple(
+        (k, isinstance(v, Item.Metadata.Enumerable)) for k, v in row.metadata.items()
+    )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Encoder:
+    Signature = Signature
+
+    kind: Item.Kind
+    keys: tuple[Item.Metadata.Key, ...]
+    columns: tuple[str, ...]
+    converters: tuple[Convert, ...]
+    compared: tuple[bool, ...]
+
+    def fields(self, row: Row, default: typing.Any = None) -> tuple[typing.Any, ...]:
+        return (
+            row.status,
+            row.chain,
+            row.digest,
+            row.created,
+            row.reserver,
+            *(row.metadata.value.get(k, default) for k in self.keys),
+        )
+
+    def __call__(self, row: Row) -> tuple[Item.Value, ...]:
+        return tuple(c(f) for c, f in zip(self.converters, self.fields(row)))
+
+    def values(self, row: Row) -> dict[str, Item.Value]:
+        return dict(zip(self.columns, self(row)))
+
+    def diff(self, old: Row, new: Row) -> dict[str, Item.Value]:
+        return {
+            column: convert(n)
+            for column, convert, compared, n, o in zip(
+                self.columns,
+                self.converters,
+                self.compared,
+                self.fields(new),
+                self.fields(old, absent),
+            )
+            if not (compared and (n == o))
+        }
+
+
+def enumerated(
+    cache_id: str,
+    enum: Transforms.Safe[Item.Key, str],
+    kind: Item.Kind,
+    key: Item.Key,
+) -> tuple[str, Convert]:
+    return enum(key), Enumerated(cache_id=cache_id, table=Enums.table_name(kind, key))
+
+
+@functools.lru_cache(maxsize=1024)
+def encoder(
+    cache_id: str,
+    enum: Transforms.Safe[Item.Key, str],
+    kind: Item.Kind,
+    signature: Signature,
+    *,
+    compact: bool = False,
+) -> Encoder:
+    metadata = (
+        (
+            enumerated(cache_id, enum, kind, Item.Key(k.value))
+            if is_enum
+            else (k.value, same)
+        )
+        for k, is_enum in signature
+    )
+    columns, converters = zip(
+        enumerated(cache_id, enum, kind, Item.Key("status")),
+        *layouts[compact],
+        *metadata,
+    )
+    return Encoder(
+        kind=kind,
+        keys=tuple(k for k, _ in signature),
+        columns=columns,
+        converters=converters,
+        compared=tuple(c != "reserver" for c in columns),
+    )
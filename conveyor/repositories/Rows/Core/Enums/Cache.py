@@ -1,3 +1,4 @@
+import typing
 import dataclasses
 import sqlalchemy
 
@@ -17,16 +18,21 @@ class TableCache:
 class Cache(dict[str, TableCache]):
     TableCache = TableCache
 
+    def store(self, table: str, rows: typing.Iterable[sqlalchemy.Row[typing.Any]]):
+        cache = self.setdefault(table, TableCache(value={}, description={}))
+        for r in rows:
+            value, description = r.value, Item.Metadata.Enumerable(r.description)
+            cache.description[value] = description
+            cache.value[description] = value
+
+    def fetch(self, table: str, connection: sqlalchemy.Connection):
+        self.store(
+            table,
+            connection.execute(
+                sqlalchemy.sql.select(columns).select_from(sqlalchemy.text(table))
+            ),
+        )
+
     def load(self, table: str, connect: Connect):
         with connect() as connection:
-            for r in connection.execute(
-                sqlalchemy.sql.select(columns).select_from(sqlalchemy.text(table))
-            ):
-                value, description = r.value, Item.Metadata.Enumerable(r.description)
-                if table in self:
-                    self[table].description[value] = description
-                    self[table].value[description] = value
-                else:
-                    self[table] = TableCache(
-                        value={description: value}, description={value: description}
-                    )
+            self.fetch(table, connection)
@@ -1,5 +1,6 @@
 import typing
 import itertools
+import contextlib
 import sqlalchemy
 import dataclasses
 import sqlalchemy.exc
@@ -12,6 +13,12 @@ from ..DbTableName import DbTableName
 
 from .Columns import columns
 
+prefix = "_conveyor_enum"
+
+
+def table_name(kind: Item.Kind, field: Item.Key) -> str:
+    return DbTableName(f"{prefix}_{kind.value}")(Item.Kind(field.value))
+
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class EnumsTransform:
@@ -34,38 +41,54 @@ class Integer(EnumsTransform, Transforms.Trusted[Item.Metadata.Enumerable, int])
         return sqlalchemy.Table(self.enum_table, sqlalchemy.MetaData(), *columns())
 
     def transform(self, i: Item.Metadata.Enumerable) -> int:
+        description = Item.Metadata.Enumerable(i.value)
         try:
-            return self.cache[self.enum_table].value[Item.Metadata.Enumerable(i.value)]
+            return self.cache[self.enum_table].value[description]
         except KeyError:
-            """"""
-
-        try:
-            self.load()
-            return self.cache[self.enum_table].value[Item.Metadata.Enumerable(i.value)]
-        except Exception:
-            """"""
+            return self.many((description,))[description]
+
+    def _missing(
+        self, descriptions: typing.Iterable[Item.Metadata.Enumerable]
+    ) -> frozenset[Item.Metadata.Enumerable]:
+        if self.enum_table not in self.cache:
+            return frozenset(descriptions)
+        known = self.cache[self.enum_table].value
+        return frozenset(d for d in descriptions if d not in known)
+
+    def _select(self, descriptions: frozenset[Item.Metadata.Enumerable]) -> None:
+        table = self.table
+        statement = sqlalchemy.select(*table.columns).where(
+            table.c.description.in_([d.value for d in descriptions])
+        )
+        with self.connect() as connection:
+            self.cache.store(self.enum_table, connection.execute(statement))
 
-        try:
-            with self.connect() as connection:
-                value = connection.execute(
-                    sqlalchemy.text(
-                        f"insert into {self.enum_table} (description) "
-                        f"values ('{i.value}') returning value"
-                    )
-                ).scalar_one()
-        except Exception:
-            with self.connect() as connection:
-                self.table.create(bind=connection)
-                value = connection.execute(
-                    sqlalchemy.text(
-                        f"insert into {self.enum_table} (description) values "
-                        f"('{i.value}') returning value"
-                    )
-                ).scalar_one()
-            self.load()
-
-        self.cache[self.enum_table].value[Item.Metadata.Enumerable(i.value)] = value
-        return value
+    def _insert(self, descriptions: frozenset[Item.Metadata.Enumerable]) -> None:
+        statement = sqlalchemy.text(
+            f"insert into {self.enum_table} (description) values (:description) "
+            "on conflict (description) do nothing"
+        )
+        values = [{"description": d.value} for d in descriptions]
+        with self.connect() as connection:
+            try:
+                with connection.begin_nested():
+                    connection.execute(statement, values)
+            except sqlalchemy.exc.DBAPIError:
+                self.table.create(bind=connection, checkfirst=True)
+                connection.execute(statement, values)
+
+    def many(
+        self, descriptions: typing.Iterable[Item.Metadata.Enumerable]
+    ) -> dict[Item.Metadata.Enumerable, int]:
+        wanted = frozenset(Item.Metadata.Enumerable(d.value) for d in descriptions)
+        if missing := self._missing(wanted):
+            with contextlib.suppress(sqlalchemy.exc.DBAPIError):
+                self._select(missing)
+        if missing := self._missing(wanted):
+            self._insert(missing)
+            self._select(missing)
+        value = self.cache[self.enum_table].value
+        return {d: value[d] for d in wanted}
 
     def __invert__(self) -> "String":
         return String(
@@ -114,9 +137,7 @@ class Enum:
     @property
     def table(self) -> sqlalchemy.Table:
         return sqlalchemy.Table(
-            DbTableName(f"_conveyor_enum_{self.kind.value}")(
-                Item.Kind(self.field.value)
-            ),
+            table_name(self.kind, self.field),
             sqlalchemy.MetaData(),
             *columns(),
         )
@@ -36,6 +36,14 @@ Column = (
 )
 
 
+compact_types: dict[str, tuple[sqlalchemy.types.TypeEngine, bool]] = {
+    "digest": (sqlalchemy.LargeBinary(), False),
+    "chain": (sqlalchemy.LargeBinary(), False),
+    "created": (sqlalchemy.BigInteger(), False),
+    "reserver": (sqlalchemy.LargeBinary(), True),
+}
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class Field:
     name: Item.Key
@@ -45,6 +53,7 @@ class Field:
     transform: Transforms.Safe[Item.Kind, str]
 
     enums: Enums.Enums
+    compact: bool = False
 
     @property
     def db_name(self) -> str:
@@ -70,6 +79,7 @@ class Field:
 
         def __iter__(self):
             return itertools.chain(
+                self.compact,
                 self.enumerable,
                 self.digest,
                 self.chain,
@@ -81,6 +91,14 @@ class Field:
                 self.datetime,
             )
 
+        @property
+        def compact(self):
+            if self.source.compact and (self.source.name.value in compact_types):
+                type_, nullable = compact_types[self.source.name.value]
+                yield sqlalchemy.Column(
+                    self.source.name.value, type_, nullable=nullable
+                )
+
         @property
         def enumerable(self):
             if isinstance(self.source.value, Item.Metadata.Enumerable):
@@ -163,6 +181,7 @@ class Fields:
     transform: Transforms.Safe[Item.Kind, str]
 
     enums: Enums.Enums
+    compact: bool = False
 
     ignore = {"kind", "data", "metadata"}
 
@@ -175,6 +194,7 @@ class Fields:
                 table=self.table,
                 enums=self.enums,
                 transform=self.transform,
+                compact=self.compact,
             )
 
         for k in self.row.metadata:
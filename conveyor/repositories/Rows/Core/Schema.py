@@ -0,0 +1,40 @@
+import typing
+import sqlalchemy
+import dataclasses
+import sqlalchemy.exc
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Schema:
+    tables: dict[str, frozenset[str]] = dataclasses.field(default_factory=dict)
+
+    def columns(
+        self, connection: sqlalchemy.Connection, name: str
+    ) -> frozenset[str] | None:
+        if name not in self.tables:
+            try:
+                self.tables[name] = frozenset(
+                    c["name"] for c in sqlalchemy.inspect(connection).get_columns(name)
+                )
+            except sqlalchemy.exc.NoSuchTableError:
+                return None
+        return self.tables[name]
+
+    def missing(
+        self,
+        connection: sqlalchemy.Connection,
+        name: str,
+        columns: typing.Iterable[str],
+    ) -> bool:
+        if (known := self.columns(connection, name)) is None:
+            return True
+        return not known.issuperset(columns)
+
+    def remember(self, name: str, columns: typing.Iterable[str]) -> None:
+        self.tables[name] = self.tables.get(name, frozenset()) | frozenset(columns)
+
+    def forget(self, name: str | None = None) -> None:
+        if name is None:
+            self.tables.clear()
+        else:
+            self.tables.pop(name, None)
@@ -0,0 +1,68 @@
+import typing
+import datetime
+import functools
+import sqlalchemy
+
+Shape = tuple[tuple[str, bool], ...]
+
+
+def shape(values: typing.Mapping[str, typing.Any]) -> Shape:
+    return tuple(
+        (name, isinstance(value, datetime.datetime)) for name, value in values.items()
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def table(name: str, columns: Shape = ()) -> sqlalchemy.TableClause:
+    return sqlalchemy.table(
+        name,
+        *(
+            sqlalchemy.column(c, sqlalchemy.DateTime() if is_datetime else None)
+            for c, is_datetime in columns
+        ),
+    )
+
+
+def columns(names: typing.Iterable[str]) -> tuple[sqlalchemy.ColumnClause, ...]:
+    return tuple(sqlalchemy.literal_column(n) for n in names)
+
+
+def sorted_(
+    column: sqlalchemy.ColumnClause[typing.Any], *, descending: bool
+) -> sqlalchemy.ColumnElement[typing.Any]:
+    if descending:
+        return column.desc().nulls_last()
+    return column.asc().nulls_first()
+
+
+def beyond(
+    column: sqlalchemy.ColumnClause[typing.Any],
+    value: typing.Any,
+    *,
+    descending: bool,
+) -> sqlalchemy.ColumnElement[bool]:
+    if value is None:
+        return sqlalchemy.false() if descending else column.is_not(None)
+    if descending:
+        return sqlalchemy.or_(column < value, column.is_(None))
+    return column > value
+
+
+def after(
+    columns: typing.Sequence[sqlalchemy.ColumnClause[typing.Any]],
+    cursor: typing.Sequence[typing.Any],
+    *,
+    descending: bool,
+) -> sqlalchemy.ColumnElement[bool]:
+    return sqlalchemy.or_(
+        *(
+            sqlalchemy.and_(
+                *(
+                    c.is_(v) if v is None else c == v
+                    for c, v in zip(columns, cursor[:i])
+                ),
+                beyond(columns[i], cursor[i], descending=descending),
+            )
+            for i in range(len(columns))
+        )
+    )
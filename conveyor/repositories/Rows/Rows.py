@@ -3,7 +3,7 @@ import contextlib
 import dataclasses
 
 from .Core.Core import Core
-from ...core import Item, Query, Part, PartRepository
+from ...core import Item, Query, Part, Changes, PartRepository
 
 
 @dataclasses.dataclass(frozen=True, kw_only=False)
@@ -15,18 +15,32 @@ class Rows(PartRepository):
     def append(self, item: Item) -> None:
         return self.rows.append(self.rows.Item.from_item(item))
 
+    def append_many(self, items: typing.Iterable[Item]) -> None:
+        return self.rows.append_many(self.rows.Item.from_item(i) for i in items)
+
+    def _part(self, accumulator: Part, r: Core.Item) -> Part:
+        return accumulator.trusted(
+            kind_=r.kind,
+            status_=r.status,
+            digest_=r.digest,
+            chain_=None if r.chain is None else Item.Chain(ref=r.chain),
+            metadata_=r.metadata,
+            created_=r.created,
+            reserver_=r.reserver,
+        )
+
     def get(self, item_query: Query, accumulator: Part) -> typing.Iterable[Part]:
         for r in self.rows[item_query]:
-            yield dataclasses.replace(
-                accumulator,
-                kind_=r.kind,
-                status_=r.status,
-                digest_=r.digest,
-                chain_=Item.Chain(ref=r.chain),
-                metadata_=r.metadata,
-                created_=r.created,
-                reserver_=r.reserver,
-            )
+            yield self._part(accumulator, r)
+
+    def reserve(
+        self, item_query: Query, reserver: Item.Reserver, accumulator: Part
+    ) -> typing.Iterable[Part]:
+        for r in self.rows.reserve(item_query, reserver):
+            yield self._part(accumulator, r)
+
+    def count(self, mask: Query.Mask) -> int:
+        return self.rows.count(mask)
 
     def __setitem__(self, old: Item, new: Item) -> None:
         self.rows[self.rows.Item.from_item(old)] = self.rows.Item.from_item(new)
@@ -34,11 +48,24 @@ class Rows(PartRepository):
     def __delitem__(self, item: Item) -> None:
         del self.rows[self.rows.Item.from_item(item)]
 
+    def update_where(self, mask: Query.Mask, changes: Changes) -> int:
+        return self.rows.update_where(mask, changes)
+
+    def delete_where(
+        self, mask: Query.Mask, deleted: typing.Sequence[Part]
+    ) -> typing.Sequence[Part]:
+        return (
+            *(Part(kind_=mask.kind, digest_=d) for d in self.rows.delete_where(mask)),
+        )
+
     @contextlib.contextmanager
     def transaction(self) -> typing.Iterator[typing.Self]:
         with self.rows.transaction() as t:
             yield dataclasses.replace(self, rows=t)
 
+    def preload(self) -> None:
+        self.rows.preload()
+
     def __len__(self) -> int:
         return len(self.rows)
 
@@ -1,4 +1,6 @@
 from .Rows import Rows as Rows
 from .Files import Files as Files
+from .Cache import Cache as Cache
+from .Memory import Memory as Memory
 
-__all__ = ["Rows", "Files"]
+__all__ = ["Rows", "Files", "Cache", "Memory"]
@@ -0,0 +1,102 @@
+import pytest
+import pathlib
+import dataclasses
+
+from conveyor.core import Item, Part, Query, Repository
+from conveyor.repositories import Cache, Files, Rows
+
+from ..common import *
+
+
+@pytest.fixture
+def cache() -> Cache.Core:
+    return Cache.Core(capacity=3)
+
+
+@pytest.fixture
+def cached(files: Files.Core, cache: Cache.Core) -> Cache:
+    return Cache(Files(files), cache=cache)
+
+
+def read(cached: Cache, item: Item, query_all: Query) -> bytes:
+    (got,) = cached.get(query_all, Part(digest_=item.data.digest))
+    return bytes(got.data.value)
+
+
+def test_hit(cached: Cache, cache: Cache.Core, item: Item, query_all: Query):
+    cached.append(item)
+    for _ in range(3):
+        assert read(cached, item, query_all) == item.data.value
+    assert cache.statistics == Cache.Core.Statistics(hits=2, misses=1, size=1)
+
+
+def test_evict(cached: Cache, cache: Cache.Core, item: Item, query_all: Query):
+    items = [dataclasses.replace(item, data=Item.Data(value=v)) for v in (b"ab", b"cd")]
+    cached.append_many(items)
+
+    for i in (*items, *items):
+        assert read(cached, i, query_all) == i.data.value
+    assert cache.statistics == Cache.Core.Statistics(misses=4, evictions=3, size=2)
+
+
+def test_disk(files: Files.Core, item: Item, query_all: Query, tmp_path: pathlib.Path):
+    cached = Cache(Files(files), cache=Cache.Core(capacity=0, root=tmp_path))
+    cached.append(item)
+    assert read(cached, item, query_all) == item.data.value
+
+    files.clear()
+    cache = Cache.Core(capacity=0, root=tmp_path)
+    reopened = Cache(Files(files), cache=cache)
+    assert read(reopened, item, query_all) == item.data.value
+    assert cache.statistics == Cache.Core.Statistics(disk_hits=1, disk_size=1)
+
+
+def test_repository(
+    files: Files.Core, rows: Rows.Core, cache: Cache.Core, item: Item, query_all: Query
+):
+    repository = Repository([Rows(rows), Cache(Files(files), cache=cache)])
+    repository.clear()
+    repository.append(item)
+
+    (saved,) = repository[query_all]
+    assert saved.data.value == item.data.value
+    assert cache.statistics.size == 1
+
+    del repository[saved]
+    assert not cache.statistics.size
+    assert not len(repository)
+
+
+def test_oversized(cache: Cache.Core):
+    data = Item.Data(value=memoryview(b"abcd"))
+    assert cache.put(data) is data
+    assert cache.statistics == Cache.Core.Statistics()
+
+
+def test_disk_bounded(tmp_path: pathlib.Path):
+    cache = Cache.Core(capacity=0, root=tmp_path, disk_capacity=3)
+    for v in (b"ab", b"cd", b"abcd"):
+        cache.put(Item.Data(value=v))
+    assert [p.stat().st_size for p in tmp_path.iterdir()] == [2]
+    assert cache.statistics == Cache.Core.Statistics(disk_evictions=1, disk_size=2)
+
+
+def test_disk_corrupt(tmp_path: pathlib.Path):
+    cache = Cache.Core(capacity=0, root=tmp_path)
+    data = Item.Data(value=b"ab")
+    cache.put(data)
+    cache.path(data.digest).write_bytes(b"cd")
+
+    assert cache[data.digest] is None
+    assert not cache.path(data.digest).exists()
+    assert not cache.statistics.disk_size
+
+
+def test_get_many(cached: Cache, cache: Cache.Core, item: Item, query_all: Query):
+    items = [dataclasses.replace(item, data=Item.Data(value=v)) for v in (b"a", b"b")]
+    cached.append_many(items)
+    read(cached, items[0], query_all)
+
+    got = cached.get_many(query_all, [Part(digest_=i.data.digest) for i in items])
+    assert [bytes(p.data.value) for p in got] == [b"a", b"b"]
+    assert cache.statistics == Cache.Core.Statistics(hits=1, misses=2, size=2)
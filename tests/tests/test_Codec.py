@@ -0,0 +1,111 @@
+import io
+import pytest
+import struct
+import datetime
+import dataclasses
+
+from conveyor.core import Codec, Item
+
+from ..common import *
+
+
+@pytest.fixture
+def rich(item: Item) -> Item:
+    return dataclasses.replace(
+        item,
+        metadata=Item.Metadata(
+            {
+                Item.Metadata.Key("str"): "value",
+                Item.Metadata.Key("int"): -12,
+                Item.Metadata.Key("float"): 1.5,
+                Item.Metadata.Key("none"): None,
+                Item.Metadata.Key("datetime"): datetime.datetime(2020, 1, 1),
+                Item.Metadata.Key("aware"): datetime.datetime(
+                    2020, 1, 1, tzinfo=datetime.UTC
+                ),
+                Item.Metadata.Key("enum"): Item.Metadata.Enumerable("a"),
+                Item.Metadata.Key("enum_none"): Item.Metadata.Enumerable(None),
+            }
+        ),
+        reserver=Item.Reserver(),
+    )
+
+
+def test_inline(rich: Item):
+    decoded = Codec().decode(Codec().encode(rich))
+    assert decoded == rich
+    assert decoded.reserver == rich.reserver
+    for k, v in rich.metadata.items():
+        assert type(decoded.metadata[k]) is type(v)
+
+
+def test_unreserved(item: Item):
+    assert Codec().decode(Codec().encode(item)).reserver.value is None
+
+
+def test_reference(item: Item):
+    codec = Codec(inline=False)
+    decoded = codec.decode(codec.encode(item))
+    assert decoded.data.digest == item.data.digest
+    with pytest.raises(KeyError):
+        decoded.data.value
+
+    resolving = Codec(inline=False, resolve=lambda _: item.data)
+    assert resolving.decode(codec.encode(item)).data.value == item.data.value
+
+    wrong = Codec(inline=False, resolve=lambda _: Item.Data(value=b"wrong"))
+    with pytest.raises(ValueError):
+        wrong.decode(codec.encode(item)).data.value
+
+
+def test_many(item: Item, rich: Item):
+    items = [item, rich, item]
+    assert [*Codec().decode_many(Codec().encode_many(items))] == items
+
+    stream = io.BytesIO()
+    Codec().write(items, stream)
+    stream.seek(0)
+    assert [*Codec().read(stream)] == items
+
+
+def test_invalid_header(item: Item):
+    encoded = Codec().encode(item)
+    with pytest.raises(ValueError):
+        Codec().decode(b"XXX" + encoded[3:])
+    with pytest.raises(ValueError):
+        Codec().decode(encoded[:3] + b"\xff" + encoded[4:])
+
+
+def test_trailing(item: Item):
+    with pytest.raises(ValueError):
+        Codec().decode(Codec().encode(item) + b" ")
+
+
+@pytest.mark.parametrize("value", (2**63, -(2**63) - 1, 10**40, -(10**40)))
+def test_big_int(item: Item, value: int):
+    big = dataclasses.replace(
+        item, metadata=Item.Metadata({Item.Metadata.Key("int"): value})
+    )
+    assert Codec().decode(Codec().encode(big)).metadata["int"] == value
+
+
+def test_truncated(rich: Item):
+    encoded = Codec().encode(rich)
+    for end in range(len(encoded)):
+        with pytest.raises(ValueError):
+            Codec().decode(encoded[:end])
+
+
+def test_truncated_many(rich: Item):
+    encoded = Codec().encode_many([rich])
+    for end in range(len(Codec.magic) + 2, len(encoded)):
+        with pytest.raises(ValueError):
+            [*Codec().decode_many(encoded[:end])]
+
+
+def test_trailing_record(rich: Item):
+    encoded = Codec().encode_many([rich])
+    header, record = encoded[: len(Codec.magic) + 1], encoded[len(Codec.magic) + 9 :]
+    padded = header + struct.pack("<Q", len(record) + 1) + record + b" "
+    with pytest.raises(ValueError):
+        [*Codec().decode_many(padded)]
@@ -9,3 +9,8 @@ def test_checking_value():
         Created(datetime.datetime.now(datetime.UTC) + datetime.timedelta(minutes=1))
 
     Created(datetime.datetime.now(datetime.UTC))
+
+
+def test_trusted_not_checking_value():
+    value = datetime.datetime.now(datetime.UTC) + datetime.timedelta(minutes=1)
+    assert Created.trusted(value).value == value
@@ -37,3 +37,13 @@ def test_creator_create_many_items(worker: Worker.Worker, item: Item, query_all:
         assert len(worker.repository) == n * (j + 1)
         for i in worker.repository[query_all]:
             assert i == item
+
+
+def test_preload_once(
+    worker: Worker.Worker, item: Item, monkeypatch: pytest.MonkeyPatch
+):
+    calls = []
+    monkeypatch.setattr(Repository, "preload", lambda self: calls.append(self))
+    for _ in range(3):
+        worker((item,))
+    assert len(calls) == 1
@@ -1,6 +1,6 @@
 import pytest
 
-from conveyor.core.Item import Data, Digest
+from conveyor.core.Item import Data, Digest, Lazy
 
 
 def test_checking_digest():
@@ -23,3 +23,30 @@ def test_equal():
     assert Data(value=v) == Data(value=v)
     assert Data(value=v) != Data(value=b"x")
     assert Data(value=v) != Data(value=b"  ")
+
+
+def test_digest_cached():
+    d = Data(value=b" ")
+    assert d.digest is d.digest
+
+
+def test_algorithm_tag():
+    v = b" "
+    d = Data(value=v, algorithm=Data.Algorithm.named("blake2b"))
+    assert d.digest.algorithm == "blake2b"
+    assert d.digest != Data(value=v).digest
+    Data(value=v, test=d.digest)
+
+
+def test_lazy():
+    data = Data(value=b" ")
+    loaded: list[Data] = []
+
+    lazy = Lazy(digest=data.digest, load=lambda: loaded.append(data) or data)
+    assert lazy.digest == data.digest
+    assert lazy == data
+    assert not loaded
+
+    assert lazy.value == data.value
+    assert lazy.value == data.value
+    assert len(loaded) == 1
@@ -35,3 +35,18 @@ def test_not_equal_another_with_another_length():
 def test_not_equal_not_digest():
     with pytest.raises(TypeError):
         assert Digest(b" " * 32) == "lalala"
+
+
+def test_string_default_algorithm_untagged():
+    d = Digest(b" " * 32)
+    assert Digest.from_base64(d.string) == d
+
+
+def test_string_algorithm_tagged():
+    d = Digest(b" " * 32, "blake2b")
+    assert d.string.startswith("blake2b-")
+    assert Digest.from_base64(d.string) == d
+
+
+def test_not_equal_another_algorithm():
+    assert Digest(b" " * 32) != Digest(b" " * 32, "blake2b")
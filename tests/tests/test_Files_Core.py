@@ -99,3 +99,62 @@ def test_transaction_append_many(files: Files.Core, data: Data):
             t.append(Data(value=data.value + str(i).encode()))
             assert len(t) == 0
     assert len(files) == 3
+
+
+@pytest.mark.parametrize("value", (b"", b"v"))
+def test_append_another_algorithm(files: Files.Core, value: bytes):
+    d = Data(value=value, algorithm=Data.Algorithm.named("blake2b"))
+    files.append(d)
+    assert files[d.digest] == d
+
+
+@pytest.fixture
+def mapped(files: Files.Core) -> Files.Core:
+    return dataclasses.replace(
+        files, prepare=Files.Core.Transforms.Nothing(), map_threshold=0
+    )
+
+
+def test_append_mapped(mapped: Files.Core, data: Data):
+    mapped.append(data)
+    assert isinstance(mapped[data.digest].value, bytes)
+
+    with mapped.mapped() as m:
+        for _ in range(2):
+            m.append(data)
+            got = m[data.digest]
+            assert isinstance(got.value, memoryview)
+            assert got == data
+            assert got.string == data.string
+
+        m.append(Data(value=bytes(got.value) + b" "))
+        assert len(m) == 2
+
+    with pytest.raises(ValueError):
+        got.value.tobytes()
+
+
+def test_mapped_slice_kept(mapped: Files.Core, data: Data):
+    mapped.append(data)
+    with mapped.mapped() as m:
+        got = m[data.digest]
+        kept = got.value[0:1]
+
+    with pytest.raises(ValueError):
+        got.value.tobytes()
+    assert bytes(kept) == bytes(data.value)[0:1]
+
+
+def test_verification_statistics(files: Files.Core, data: Data):
+    files.append(data)
+    for _ in range(2):
+        assert files[data.digest] == data
+    assert files.verification.statistics.verified == 2
+
+
+def test_append_many(files: Files.Core, data: Data):
+    many = [Data(value=data.value + str(i).encode()) for i in range(3)]
+    files.append_many([*many, *many])
+    assert len(files) == 3
+    for d in many:
+        assert files[d.digest] == d
@@ -0,0 +1,193 @@
+import pytest
+import dataclasses
+
+from conveyor.core import Item, Part, Query, Repository
+from conveyor.repositories import Memory
+
+from ..common import *
+
+
+@pytest.fixture
+def memory() -> Memory:
+    return Memory(indexed=frozenset({Item.Metadata.Key("key")}))
+
+
+@pytest.fixture
+def items(item: Item) -> list[Item]:
+    return [
+        dataclasses.replace(
+            item,
+            status=Item.Status(status),
+            metadata=Item.Metadata({Item.Metadata.Key("key"): key}),
+        )
+        for status, key in (("a", "x"), ("a", "y"), ("b", "x"), ("a", "x"))
+    ]
+
+
+def got(memory: Memory, mask: Query.Mask, limit: Query.Limit = None) -> list[Item]:
+    return [p.item for p in memory.get(Query(mask=mask, limit=limit), Part())]
+
+
+def test_get(memory: Memory, items: list[Item], item: Item):
+    memory.append_many(items)
+
+    assert got(memory, Query.Mask(kind=item.kind)) == items
+    assert got(memory, Query.Mask(kind=Item.Kind("other"))) == []
+    assert memory.count(Query.Mask(kind=item.kind, status=Item.Status("a"))) == 3
+    assert got(memory, Query.Mask(kind=item.kind, status=Item.Status("a"))) == [
+        items[0],
+        items[1],
+        items[3],
+    ]
+    assert got(
+        memory,
+        Query.Mask(
+            kind=item.kind,
+            status=Item.Status("a"),
+            metadata=Item.Metadata({Item.Metadata.Key("key"): "x"}),
+        ),
+        limit=1,
+    ) == [items[0]]
+
+
+def test_not_indexed(item: Item, items: list[Item]):
+    memory = Memory()
+    memory.append_many(items)
+
+    assert (
+        len(
+            got(
+                memory,
+                Query.Mask(
+                    kind=item.kind,
+                    metadata=Item.Metadata({Item.Metadata.Key("key"): "x"}),
+                ),
+            )
+        )
+        == 3
+    )
+
+
+def test_setitem_delitem(memory: Memory, item: Item):
+    memory.append(item)
+
+    changed = dataclasses.replace(item, status=Item.Status("changed"))
+    memory[item] = changed
+    with pytest.raises(KeyError):
+        memory[item] = changed
+
+    assert got(memory, Query.Mask(kind=item.kind)) == [changed]
+    del memory[changed]
+    assert not len(memory)
+
+
+def test_transaction(memory: Memory, item: Item, items: list[Item]):
+    memory.append(item)
+
+    with pytest.raises(KeyError):
+        with memory.transaction() as t:
+            t.append_many(items)
+            with t.transaction() as nested:
+                del nested[item]
+            raise KeyError
+    assert got(memory, Query.Mask(kind=item.kind)) == [item]
+
+    with pytest.raises(KeyError):
+        with memory.transaction() as t:
+            t.append_many(items)
+            with t.transaction() as nested:
+                del nested[item]
+                raise KeyError
+    assert got(memory, Query.Mask(kind=item.kind)) == [item]
+
+
+def test_repository(memory: Memory, item: Item, items: list[Item]):
+    repository = Repository([memory])
+    repository.append_many(items)
+    query = Query(mask=Query.Mask(kind=item.kind, status=Item.Status("a")), limit=2)
+
+    assert len(repository.reserve(query, 2)) == 2
+    assert len([*repository[query]]) == 1
+    assert not [*repository[query]]
+
+    assert (
+        repository.update_where(
+            Query.Mask(kind=item.kind, status=Item.Status("a")),
+            Repository.Changes(status=Item.Status("c")),
+        )
+        == 3
+    )
+    assert repository.delete_where(Query.Mask(kind=item.kind)) == 4
+    assert not len(repository)
+
+
+def test_order(memory: Memory, items: list[Item], item: Item):
+    memory.append_many(items)
+    order = Query.Order(("key",), descending=True)
+
+    assert [
+        p.item
+        for p in memory.get(
+            Query(mask=Query.Mask(kind=item.kind), limit=2, order=order), Part()
+        )
+    ] == [items[1], items[0]]
+    assert [
+        p.item
+        for p in memory.get(
+            Query(
+                mask=Query.Mask(kind=item.kind),
+                limit=None,
+                order=order,
+                after=("y",),
+            ),
+            Part(),
+        )
+    ] == [items[0], items[2], items[3]]
+
+
+def test_predicates(memory: Memory, items: list[Item], item: Item):
+    memory.append_many(items)
+
+    assert got(
+        memory,
+        Query.Mask(kind=item.kind, predicates={"key": Query.Mask.In(("y", "z"))}),
+    ) == [items[1]]
+    assert got(
+        memory,
+        Query.Mask(
+            kind=item.kind,
+            status=Item.Status("a"),
+            predicates={"key": Query.Mask.Not("y")},
+        ),
+    ) == [items[0], items[3]]
+    assert got(
+        memory,
+        Query.Mask(kind=item.kind, predicates={"key": Query.Mask.Range(lower="y")}),
+    ) == [items[1]]
+    assert (
+        got(
+            memory,
+            Query.Mask(kind=item.kind, predicates={"absent": Query.Mask.Null()}),
+        )
+        == items
+    )
+
+
+def test_projection(memory: Memory, items: list[Item], item: Item):
+    memory.append_many(items)
+
+    part, *_ = memory.get(
+        Query(
+            mask=Query.Mask(kind=item.kind),
+            limit=1,
+            projection=Query.Projection(fields=frozenset({"status"})),
+        ),
+        Part(),
+    )
+    assert part.status == items[0].status
+    assert part.digest == items[0].data.digest
+    assert part.metadata == Item.Metadata({})
+    with pytest.raises(KeyError):
+        part.data
+    with pytest.raises(KeyError):
+        part.created
@@ -0,0 +1,70 @@
+import copy
+import types
+import pickle
+import typing
+import pytest
+
+from conveyor.core import Item
+
+from ..common import *
+
+
+@pytest.fixture
+def metadata() -> Item.Metadata:
+    return Item.Metadata({Item.Metadata.Key("key"): "value"})
+
+
+def test_value_cached(metadata: Item.Metadata):
+    assert metadata.value is metadata.value
+
+
+def test_merge_unchanged(metadata: Item.Metadata):
+    assert metadata | {Item.Metadata.Key("key"): "value"} is metadata
+    assert metadata | {} is metadata
+
+
+def test_merge_changed(metadata: Item.Metadata):
+    changed = metadata | {Item.Metadata.Key("key"): 1}
+    assert changed["key"] == 1
+    assert isinstance(changed["key"], int)
+    assert metadata["key"] == "value"
+
+
+def test_merge_metadata_overrides(metadata: Item.Metadata):
+    merged = metadata | Item.Metadata({Item.Metadata.Key("key"): "another"})
+    assert merged["key"] == "another"
+
+
+def test_hash(metadata: Item.Metadata):
+    same = Item.Metadata({Item.Metadata.Key("key"): "value"})
+    assert hash(same) == hash(metadata)
+    assert same == metadata
+    assert metadata != metadata | {Item.Metadata.Key("key"): "another"}
+
+
+def test_source_copied():
+    source = {Item.Metadata.Key("key"): "value"}
+    metadata = Item.Metadata(source)
+    hash(metadata)
+    source[Item.Metadata.Key("key")] = "changed"
+    assert metadata["key"] == "value"
+    assert metadata == Item.Metadata({Item.Metadata.Key("key"): "value"})
+
+
+def test_proxy_source_copied():
+    source = {Item.Metadata.Key("key"): "value"}
+    metadata = Item.Metadata(types.MappingProxyType(source))
+    hash(metadata)
+    source[Item.Metadata.Key("key")] = "changed"
+    assert metadata["key"] == "value"
+
+
+@pytest.mark.parametrize(
+    "copy_", [lambda i: pickle.loads(pickle.dumps(i)), copy.deepcopy]
+)
+def test_item_copied(item: Item, copy_: typing.Callable[[Item], Item]):
+    hash(item.metadata)
+    copied = copy_(item)
+    assert copied == item
+    assert hash(copied.metadata) == hash(item.metadata)
+    assert copied.metadata.value == item.metadata.value
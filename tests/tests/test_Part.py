@@ -27,3 +27,11 @@ def part():
 def test_none_fields(part: Part, field: str):
     with pytest.raises(KeyError):
         part.__getattribute__(field)
+
+
+def test_trusted(part: Part, item: Item):
+    changed = part.trusted(status_=item.status, data_=item.data)
+    assert changed.status == item.status
+    assert changed.data == item.data
+    with pytest.raises(KeyError):
+        changed.kind
@@ -1,9 +1,12 @@
 import typing
 import pytest
+import datetime
 import itertools
 import dataclasses
 
-from conveyor.core import Item, Query, Mask, Repository
+from conveyor.core import Item, Part, Query, Mask, Repository
+
+from conveyor.repositories import Memory
 
 from ..common import *
 
@@ -124,3 +127,524 @@ def test_get_exact(
 
     for i in repository[query_all]:
         del repository[i]
+
+
+def test_algorithm(repository: Repository, item: Item, query_all: Query):
+    algorithm = Item.Data.Algorithm.named("blake2b")
+    dataclasses.replace(repository, algorithm=algorithm).append(item)
+
+    saved = [*repository[query_all]]
+    assert len(saved) == 1
+    assert saved[0].data.digest.algorithm == algorithm.name
+    assert saved[0].data.value == item.data.value
+
+
+def test_mapped_files(files: Files.Core, rows: Rows.Core, item: Item, query_all: Query):
+    mapped = dataclasses.replace(
+        files, prepare=Files.Core.Transforms.Nothing(), map_threshold=0
+    )
+    with Files(mapped).mapped() as f:
+        repository = Repository([Rows(rows), f])
+        repository.append(item)
+
+        for saved in repository[query_all]:
+            assert isinstance(saved.data.value, memoryview)
+            assert saved == item
+            repository[saved] = dataclasses.replace(
+                saved, status=Item.Status("changed")
+            )
+            repository.append(dataclasses.replace(saved, kind=Item.Kind("another")))
+
+        assert len(repository) == 2
+
+
+def test_lazy_data(
+    repository: Repository, files: Files.Core, item: Item, query_all: Query
+):
+    repository.append(item)
+    files.clear()
+
+    with pytest.raises(KeyError):
+        [*repository[query_all]]
+
+    lazy = dataclasses.replace(
+        repository, parts=(repository.parts[0], Files(files, lazy=True))
+    )
+    saved = [*lazy[query_all]]
+    assert len(saved) == 1
+    assert saved[0].status == item.status
+    with pytest.raises(KeyError):
+        saved[0].data.value
+
+
+def test_reserve(repository: Repository, item: Item, query_all: Query):
+    for _ in range(3):
+        repository.append(item)
+
+    reserved = repository.reserve(query_all, 2)
+    assert len(reserved) == 2
+    assert reserved[0].reserver.value is not None
+    assert reserved[0].reserver == reserved[1].reserver
+    for i in reserved:
+        assert i == item
+        assert i.data.value == item.data.value
+
+    assert len(repository.reserve(query_all, None)) == 1
+    assert not repository.reserve(query_all, None)
+
+
+def test_reserve_rolled_back(
+    repository: Repository, files: Files.Core, item: Item, query_all: Query
+):
+    repository.append_many(
+        [item, dataclasses.replace(item, data=Item.Data(value=b"another"))]
+    )
+    files.clear()
+
+    with pytest.raises(KeyError):
+        repository.reserve(query_all, 5)
+    assert (
+        repository.count(Query.Mask(kind=item.kind, reserver=Item.Reserver(None))) == 2
+    )
+
+
+def test_append_many(repository: Repository, item: Item, query_all: Query):
+    another = dataclasses.replace(item, data=Item.Data(value=b"another"))
+    repository.append_many([item, another, item])
+
+    saved = [*repository[query_all]]
+    assert len(saved) == 3
+    assert sorted(i.data.string for i in saved) == ["another", "v", "v"]
+
+
+def test_update_where(repository: Repository, item: Item, query_all: Query):
+    other = dataclasses.replace(
+        item, status=Item.Status("other"), data=Item.Data(value=b"other")
+    )
+    repository.append_many([item, item, other])
+
+    assert (
+        repository.update_where(
+            Mask(kind=item.kind, status=item.status),
+            Repository.Changes(
+                status=Item.Status("done"),
+                metadata=Item.Metadata({Item.Metadata.Key("added"): 1}),
+            ),
+        )
+        == 2
+    )
+
+    saved = [*repository[query_all]]
+    assert sorted(i.status.value for i in saved) == ["done", "done", "other"]
+    for i in saved:
+        if i.status == Item.Status("done"):
+            assert i.metadata["added"] == 1
+            assert i.metadata["key"] == "value"
+            assert i.data == item.data
+
+
+def test_delete_where(
+    repository: Repository, files: Files.Core, item: Item, query_all: Query
+):
+    other = dataclasses.replace(
+        item, status=Item.Status("other"), data=Item.Data(value=b"other")
+    )
+    repository.append_many([item, item, other])
+
+    assert repository.delete_where(Mask(kind=item.kind, status=item.status)) == 2
+    assert len(files) == 1
+
+    saved = [*repository[query_all]]
+    assert len(saved) == 1
+    assert saved[0] == other
+    assert saved[0].data.value == b"other"
+
+    assert not repository.delete_where(Mask(kind=item.kind, status=item.status))
+
+
+def test_chunked_get(
+    files: Files.Core,
+    rows: Rows.Core,
+    item: Item,
+    query_all: Query,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    repository = Repository([Rows(rows), Files(files, lazy=False)], chunk=2)
+    repository.clear()
+
+    values = [b"a", b"b", b"c", b"a", b"v"]
+    repository.append_many(
+        dataclasses.replace(item, data=Item.Data(value=v)) for v in values
+    )
+
+    saved = [*repository[query_all]]
+    assert sorted(bytes(i.data.value) for i in saved) == sorted(values)
+
+    sizes = []
+    get_many = Files.get_many
+    monkeypatch.setattr(
+        Files,
+        "get_many",
+        lambda self, q, a: sizes.append(len(a)) or get_many(self, q, a),
+    )
+    assert len([*repository.view(query_all)]) == len(values)
+    assert sizes == [1, 2, 2]
+
+    with pytest.raises(ValueError):
+        Repository([Rows(rows)], chunk=0)
+
+
+def test_count(repository: Repository, item: Item):
+    other = dataclasses.replace(item, status=Item.Status("other"))
+    repository.append_many([item, item, other])
+
+    assert repository.count(Mask(kind=item.kind)) == 3
+    assert repository.count(Mask(kind=item.kind, status=item.status)) == 2
+    assert repository.count(Mask(kind=Item.Kind("absent"))) == 0
+
+
+def test_order(repository: Repository, item: Item):
+    items = [
+        dataclasses.replace(
+            item,
+            data=Item.Data(value=bytes([i])),
+            created=Item.Created(
+                item.created.value - datetime.timedelta(seconds=(i * 7) % 5)
+            ),
+        )
+        for i in range(5)
+    ]
+    repository.append_many(items)
+
+    order = Query.Order(("created",))
+    expected = sorted(items, key=lambda i: i.created.value)
+
+    first = sorted(
+        repository.reserve(
+            Query(mask=Mask(kind=item.kind), limit=None, order=order), 2
+        ),
+        key=lambda i: i.created.value,
+    )
+    rest = [
+        *repository[
+            Query(
+                mask=Mask(kind=item.kind),
+                limit=None,
+                order=order,
+                after=order.cursor(first[-1]),
+            )
+        ]
+    ]
+    assert [i.data.value for i in first + rest] == [i.data.value for i in expected]
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_order_metadata(repository: Repository, item: Item, descending: bool):
+    items = [
+        dataclasses.replace(
+            item,
+            data=Item.Data(value=bytes([i])),
+            metadata=Item.Metadata({Item.Metadata.Key("position"): (i * 3) % 5}),
+        )
+        for i in range(5)
+    ]
+    repository.append_many(items)
+
+    order = Query.Order(("position",), descending=descending)
+    got = [
+        *repository[
+            Query(
+                mask=Mask(kind=item.kind),
+                limit=2,
+                order=order,
+                after=(2,),
+            )
+        ]
+    ]
+    expected = [1, 0] if descending else [3, 4]
+    assert [i.metadata["position"] for i in got] == expected
+
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("backend", ["rows", "memory"])
+def test_order_nulls(rows: Rows.Core, item: Item, backend: str, descending: bool):
+    part = Rows(rows) if backend == "rows" else Memory()
+    metadata = [{"position": 1}, {"position": None}, {}, {"position": 0}]
+    part.append_many(
+        [
+            dataclasses.replace(
+                item,
+                data=Item.Data(value=bytes([i])),
+                metadata=Item.Metadata({Item.Metadata.Key(k): v for k, v in m.items()}),
+            )
+            for i, m in enumerate(metadata)
+        ]
+    )
+    order = Query.Order(("position",), descending=descending)
+
+    def positions(after: Query.Order.Cursor | None = None) -> list[int | None]:
+        return [
+            p.metadata.value.get(Item.Metadata.Key("position"))
+            for p in part.get(
+                Query(mask=Mask(kind=item.kind), limit=None, order=order, after=after),
+                Part(),
+            )
+        ]
+
+    expected = [None, None, 0, 1]
+    assert positions() == (expected[::-1] if descending else expected)
+    assert positions((None,)) == ([] if descending else [0, 1])
+    assert positions((0,)) == ([None, None] if descending else [1])
+
+
+def test_order_enumerable(repository: Repository, item: Item):
+    repository.append(
+        dataclasses.replace(
+            item,
+            metadata=Item.Metadata(
+                {Item.Metadata.Key("key"): Item.Metadata.Enumerable("x")}
+            ),
+        )
+    )
+    for key in ("key", "status"):
+        with pytest.raises(TypeError):
+            [
+                *repository[
+                    Query(
+                        mask=Mask(kind=item.kind),
+                        limit=None,
+                        order=Query.Order((key,)),
+                    )
+                ]
+            ]
+        with pytest.raises(TypeError):
+            [
+                *repository[
+                    Query(
+                        mask=Mask(kind=item.kind),
+                        limit=None,
+                        order=Query.Order((key,)),
+                        after=("x",),
+                    )
+                ]
+            ]
+
+
+def test_order_cursor_requires_order(item: Item):
+    with pytest.raises(ValueError):
+        Query(mask=Mask(kind=item.kind), limit=None, after=(1,))
+    with pytest.raises(ValueError):
+        Query(mask=Mask(kind=item.kind), limit=None, order=Query.Order(), after=())
+
+
+def test_predicates(repository: Repository, item: Item):
+    items = [
+        dataclasses.replace(
+            item,
+            status=Item.Status(status),
+            data=Item.Data(value=bytes([i])),
+            metadata=Item.Metadata(
+                {
+                    Item.Metadata.Key("key"): Item.Metadata.Enumerable(key),
+                    Item.Metadata.Key("position"): i if i != 4 else None,
+                }
+            ),
+        )
+        for i, (status, key) in enumerate(
+            (("a", "x"), ("b", "y"), ("c", "x"), ("a", "z"), ("b", None))
+        )
+    ]
+    repository.append_many(items)
+    indexes = {i.data.digest.string: n for n, i in enumerate(items)}
+
+    def positions(**predicates: Mask.Predicate) -> list[int]:
+        return sorted(
+            indexes[p.digest.string]
+            for p in repository.parts[0].get(
+                Query(mask=Mask(kind=item.kind, predicates=predicates), limit=None),
+                Part(),
+            )
+        )
+
+    assert positions(position=Mask.Range(lower=1, upper=3)) == [1, 2]
+    assert positions(position=Mask.Range(lower=2)) == [2, 3]
+    assert positions(position=Mask.Null()) == [4]
+    assert positions(position=Mask.Not(0)) == [1, 2, 3]
+    assert positions(status=Mask.In((Item.Status("a"), Item.Status("c")))) == [0, 2, 3]
+    assert positions(key=Mask.Not(Item.Metadata.Enumerable("y"))) == [0, 2, 3]
+    assert positions(key=Mask.Null()) == [4]
+    for name, bound in (
+        ("status", Item.Status("b")),
+        ("key", Item.Metadata.Enumerable("y")),
+    ):
+        with pytest.raises(TypeError):
+            positions(**{name: Mask.Range(lower=bound)})
+    assert positions(
+        key=Mask.In((Item.Metadata.Enumerable("x"), Item.Metadata.Enumerable("z"))),
+        position=Mask.Range(upper=3),
+    ) == [0, 2]
+    assert (
+        repository.count(
+            Mask(kind=item.kind, predicates={"position": Mask.Range(upper=2)})
+        )
+        == 2
+    )
+
+    with pytest.raises(ValueError):
+        Mask.Range()
+
+
+@pytest.mark.parametrize("backend", ["rows", "memory"])
+def test_enumerable_predicates(rows: Rows.Core, item: Item, backend: str):
+    part = Rows(rows) if backend == "rows" else Memory()
+    items = [
+        dataclasses.replace(
+            item,
+            status=Item.Status(status),
+            data=Item.Data(value=bytes([i])),
+            metadata=Item.Metadata(
+                {Item.Metadata.Key("key"): Item.Metadata.Enumerable(key)}
+            ),
+        )
+        for i, (status, key) in enumerate((("a", "x"), ("b", "y"), ("a", None)))
+    ]
+    part.append_many(items)
+    indexes = {i.data.digest.string: n for n, i in enumerate(items)}
+
+    def positions(**predicates: Mask.Predicate) -> list[int]:
+        return sorted(
+            indexes[p.digest.string]
+            for p in part.get(
+                Query(mask=Mask(kind=item.kind, predicates=predicates), limit=None),
+                Part(),
+            )
+        )
+
+    assert positions(status=Mask.In(("a", "c"))) == [0, 2]
+    assert positions(status=Mask.Not("a")) == [1]
+    assert positions(key=Mask.In(("x", "z"))) == [0]
+    assert positions(key=Mask.In((Item.Metadata.Enumerable("y"),))) == [1]
+    assert positions(key=Mask.Not(Item.Metadata.Enumerable("x"))) == [1]
+    assert positions(key=Mask.Null()) == [2]
+    with pytest.raises(TypeError):
+        positions(key=Mask.Range(lower=Item.Metadata.Enumerable("x")))
+
+
+def test_projection(repository: Repository, item: Item):
+    items = [
+        dataclasses.replace(
+            item,
+            data=Item.Data(value=bytes([i])),
+            metadata=Item.Metadata(
+                {
+                    Item.Metadata.Key("key"): Item.Metadata.Enumerable("x"),
+                    Item.Metadata.Key("position"): i,
+                    Item.Metadata.Key("other"): "other",
+                }
+            ),
+        )
+        for i in range(3)
+    ]
+    repository.append_many(items)
+
+    (first,) = repository.view(
+        Query(
+            mask=Mask(
+                kind=item.kind,
+                metadata=Item.Metadata({Item.Metadata.Key("position"): 0}),
+            ),
+            limit=1,
+            projection=Query.Projection(fields=frozenset({"data", "created"})),
+        )
+    )
+    assert first.data == items[0].data
+    assert first.created == items[0].created
+    with pytest.raises(KeyError):
+        first.status
+    with pytest.raises(KeyError):
+        first.metadata["position"]
+
+    projected = Query(
+        mask=Mask(kind=item.kind),
+        limit=None,
+        projection=Query.Projection(
+            fields=frozenset({"status"}),
+            metadata=frozenset(
+                {Item.Metadata.Key("key"), Item.Metadata.Key("position")}
+            ),
+        ),
+    )
+    got = [*repository.view(projected)]
+    assert sorted(i.metadata["position"] for i in got) == [0, 1, 2]
+    for i in got:
+        assert i.kind == item.kind
+        assert i.status == item.status
+        assert i.metadata["key"] == Item.Metadata.Enumerable("x")
+        with pytest.raises(KeyError):
+            i.metadata["other"]
+        with pytest.raises(KeyError):
+            i.data
+        with pytest.raises(KeyError):
+            i.chain
+    assert got == [*repository.view(projected)]
+    assert dataclasses.replace(got[0], status_=None).status_ is None
+    assert repository.count(Mask(kind=item.kind, reserver=Item.Reserver(None))) == 3
+
+    (reserved,) = repository.parts[0].reserve(
+        dataclasses.replace(projected, limit=1), Item.Reserver(), Part()
+    )
+    assert reserved.metadata["key"] == Item.Metadata.Enumerable("x")
+    with pytest.raises(KeyError):
+        reserved.created
+
+    with pytest.raises(ValueError):
+        repository.reserve(projected, None)
+    with pytest.raises(ValueError):
+        [*repository[projected]]
+    with pytest.raises(ValueError):
+        Query.Projection(fields=frozenset({"kind"}))
+
+
+@pytest.mark.parametrize(
+    "order", [None, Query.Order(("position",)), Query.Order(("position",), True)]
+)
+def test_paged_get(
+    files: Files.Core, rows: Rows.Core, item: Item, order: Query.Order | None
+):
+    repository = Repository(
+        [Rows(dataclasses.replace(rows, chunk=2)), Files(files)], chunk=3
+    )
+    items = [
+        dataclasses.replace(
+            item,
+            data=Item.Data(value=bytes([i])),
+            metadata=Item.Metadata({Item.Metadata.Key("position"): (i * 3) % 7}),
+        )
+        for i in range(7)
+    ]
+    repository.append_many(items)
+
+    after = [
+        p.digest
+        for p in repository.parts[0].get(
+            Query(
+                mask=Mask(kind=item.kind),
+                limit=None,
+                order=Query.Order(("position",), True),
+                after=(4,),
+            ),
+            Part(),
+        )
+    ]
+    assert after == [i.data.digest for i in (items[1], items[3], items[5], items[0])]
+
+    first = [*repository[Query(mask=Mask(kind=item.kind), limit=5, order=order)]]
+    rest = [*repository[Query(mask=Mask(kind=item.kind), limit=None, order=order)]]
+    assert (len(first), len(rest)) == (5, 2)
+    assert sorted(i.data.value for i in first + rest) == [bytes([i]) for i in range(7)]
+    if order is not None:
+        positions = [i.metadata["position"] for i in first + rest]
+        assert positions == sorted(positions, reverse=order.descending)
+
+    with pytest.raises(ValueError):
+        Rows.Core(rows.db, chunk=0)
@@ -1,11 +1,12 @@
 import pytest
+import sqlite3
 import typing
 import datetime
 import itertools
 import dataclasses
 
 from conveyor.repositories import Rows
-from conveyor.core import Query, Mask, Item
+from conveyor.core import Query, Mask, Item, Changes
 
 from ..common import *
 
@@ -246,3 +247,346 @@ def test_get_exact(
 
     for r in (*rows[query_all],):
         del rows[r]
+
+
+def test_trusted(row: Rows.Core.Item):
+    assert (
+        Rows.Core.Item.trusted(
+            **{f.name: getattr(row, f.name) for f in dataclasses.fields(row)}
+        )
+        == row
+    )
+
+
+def test_reserve(rows: Rows.Core, row: Rows.Core.Item, query_all: Query):
+    for _ in range(3):
+        rows.append(row)
+
+    reserver = Item.Reserver()
+    unreserved = Query(mask=Mask(kind=row.kind, reserver=Item.Reserver(None)), limit=2)
+
+    reserved = [*rows.reserve(unreserved, reserver)]
+    assert len(reserved) == 2
+    for r in reserved:
+        assert r.reserver == reserver
+        assert dataclasses.replace(r, reserver=row.reserver) == row
+
+    assert len([*rows.reserve(unreserved, reserver)]) == 1
+    assert not [*rows.reserve(unreserved, reserver)]
+
+
+def test_append_many(rows: Rows.Core, row: Rows.Core.Item, query_all: Query):
+    another_kind = dataclasses.replace(row, kind=Item.Kind("another"))
+    new_column = dataclasses.replace(
+        row,
+        metadata=row.metadata
+        | {Item.Metadata.Key("new_column"): Item.Metadata.Enumerable("lalala")},
+    )
+
+    rows.append_many([row, another_kind, row, new_column])
+    assert len(rows) == 4
+
+    assert [*rows[Query(mask=Mask(kind=another_kind.kind), limit=None)]] == [
+        another_kind
+    ]
+    assert [
+        *rows[Query(mask=Mask(kind=row.kind, metadata=new_column.metadata), limit=None)]
+    ] == [new_column]
+    assert len([*rows[query_all]]) == 3
+    assert (
+        len([*rows[Query(mask=Mask(kind=row.kind, created=row.created), limit=None)]])
+        == 3
+    )
+
+
+@pytest.mark.parametrize("counters", [None, Rows.Core.Counters()])
+def test_count(
+    db: sqlalchemy.Engine, row: Rows.Core.Item, counters: Rows.Core.Counters | None
+):
+    rows = Rows.Core(db, counters=counters)
+    rows.clear()
+
+    done = Item.Status("done")
+    other = dataclasses.replace(row, status=Item.Status("other"))
+
+    def count(status: Item.Status | None = None) -> int:
+        return rows.count(Mask(kind=row.kind, status=status))
+
+    assert not count()
+
+    rows.append(row)
+    rows.append_many([row, row, other])
+    assert (count(), count(row.status), count(other.status)) == (4, 3, 1)
+
+    rows[other] = dataclasses.replace(other, status=row.status)
+    assert (count(row.status), count(other.status)) == (4, 0)
+
+    assert rows.update_where(Mask(kind=row.kind), Changes(status=done)) == 4
+    assert (count(), count(row.status), count(done)) == (4, 0, 4)
+
+    assert len(rows.delete_where(Mask(kind=row.kind, chain=row.chain))) == 4
+    assert not count()
+
+    rows.append_many([row, other])
+    del rows[other]
+    assert (count(), count(row.status)) == (1, 1)
+    assert rows.count(Mask(kind=row.kind, metadata=row.metadata)) == 1
+
+    rows.recount()
+    assert (count(), count(row.status)) == (1, 1)
+
+
+def test_bound_parameters(rows: Rows.Core, row: Rows.Core.Item, query_all: Query):
+    quoted = dataclasses.replace(
+        row, metadata=Item.Metadata({Item.Metadata.Key("key"): "it's; --"})
+    )
+    rows.append(quoted)
+    rows.append(row)
+
+    (found,) = rows[
+        Query(
+            mask=Mask(kind=row.kind, metadata=quoted.metadata),
+            limit=None,
+        )
+    ]
+    assert found.metadata == quoted.metadata
+    assert quoted in rows
+
+    assert (
+        rows.update_where(
+            Mask(kind=row.kind, metadata=quoted.metadata),
+            Changes(metadata=Item.Metadata({Item.Metadata.Key("key"): "'; 1"})),
+        )
+        == 1
+    )
+    assert {r.metadata["key"] for r in rows[query_all]} == {"'; 1", row.metadata["key"]}
+
+
+def test_schema_registry(rows: Rows.Core, row: Rows.Core.Item):
+    rows.append(row)
+
+    statements: list[str] = []
+
+    def listener(connection, cursor, statement: str, *args):
+        statements.append(statement.lower())
+
+    sqlalchemy.event.listen(rows.db, "before_cursor_execute", listener)
+    try:
+        rows.append(row)
+        rows.append_many([row, row])
+        rows[row] = dataclasses.replace(row, status=Item.Status("other"))
+        assert not [s for s in statements if ("pragma" in s) or ("alter" in s)]
+
+        wider = dataclasses.replace(
+            row, metadata=row.metadata | {Item.Metadata.Key("wide"): 1}
+        )
+        rows.append(wider)
+        rows.append(wider)
+        assert len([s for s in statements if "alter" in s]) == 1
+    finally:
+        sqlalchemy.event.remove(rows.db, "before_cursor_execute", listener)
+
+    assert len(rows) == 6
+
+
+def test_enum_resolution(rows: Rows.Core, row: Rows.Core.Item, query_all: Query):
+    batch = [
+        dataclasses.replace(
+            row,
+            status=Item.Status(f"status_{i}"),
+            metadata=Item.Metadata(
+                {Item.Metadata.Key("tag"): Item.Metadata.Enumerable(f"tag_{i}")}
+            ),
+        )
+        for i in range(8)
+    ]
+
+    statements: list[str] = []
+
+    def listener(connection, cursor, statement: str, *args):
+        statements.append(statement.lower())
+
+    rows.append_many(batch[:1])
+    sqlalchemy.event.listen(rows.db, "before_cursor_execute", listener)
+    try:
+        rows.append_many(batch[1:])
+        assert (
+            len([s for s in statements if s.startswith("insert into _conveyor_enum_")])
+            == 2
+        )
+
+        rows._cache.clear()
+        rows.preload()
+        statements.clear()
+        rows.append_many(batch[1:])
+        assert not [s for s in statements if "_conveyor_enum_" in s]
+    finally:
+        sqlalchemy.event.remove(rows.db, "before_cursor_execute", listener)
+
+    status = rows._enums[(row.kind, Item.Key("status"))].integer
+    description = Item.Metadata.Enumerable("status_0")
+    value = status(description)
+    rows._cache.clear()
+    status._insert(frozenset({description}))
+    assert status.many([description]) == {description: value}
+
+    assert sorted(r.status.value for r in rows[query_all]) == sorted(
+        [r.status.value for r in batch] + [r.status.value for r in batch[1:]]
+    )
+
+
+def test_decoder(rows: Rows.Core, row: Rows.Core.Item, query_all: Query):
+    tagged = dataclasses.replace(
+        row,
+        metadata=row.metadata
+        | {Item.Metadata.Key("tag"): Item.Metadata.Enumerable("tag")},
+    )
+    rows.append_many([tagged, dataclasses.replace(tagged, chain="other")])
+
+    first, second = rows[query_all]
+    assert first.metadata == second.metadata == tagged.metadata
+    assert first.metadata["key"] is second.metadata["key"]
+    assert first.status is second.status
+
+    fields = ("digest", "custom", rows.enum(Item.Key("tag")), "created")
+    decoder = rows.Get(rows=rows, query=query_all).decoder(fields)
+    assert [name for name, _, _ in decoder.base] == ["created"]
+    assert set(decoder.missing) == {"status", "chain", "reserver"}
+    assert [(key.value, i) for key, _, i in decoder.metadata] == [
+        ("custom", 1),
+        ("tag", 2),
+    ]
+
+
+def test_encoder(rows: Rows.Core, row: Rows.Core.Item):
+    rows.append(row)
+    encoder = rows._encoder(row)
+    changed = dataclasses.replace(row, chain="other")
+
+    assert rows._encoder(changed) is encoder
+    assert encoder.columns == (
+        rows.enum(Item.Key("status")),
+        "chain",
+        "digest",
+        "created",
+        "reserver",
+        "key",
+    )
+    assert encoder(row)[1:] == (
+        row.chain,
+        row.digest.string,
+        row.created.value,
+        None,
+        "value",
+    )
+    assert encoder.diff(row, changed) == {"chain": "other", "reserver": None}
+
+
+def test_compact(db: sqlalchemy.Engine, row: Rows.Core.Item):
+    rows = Rows.Core(db, compact=True)
+    rows.clear()
+
+    earlier = dataclasses.replace(
+        row,
+        chain="not base64",
+        created=Item.Created(row.created.value - datetime.timedelta(seconds=1)),
+    )
+    rows.append_many([row, earlier])
+
+    columns = {
+        c["name"]: c["type"]
+        for c in sqlalchemy.inspect(db).get_columns(rows.table(row.kind))
+    }
+    for name in ("digest", "chain", "reserver"):
+        assert isinstance(columns[name], sqlalchemy.LargeBinary)
+    assert isinstance(columns["created"], sqlalchemy.BigInteger)
+
+    ordered = Query(mask=Mask(kind=row.kind), limit=None, order=Query.Order())
+    assert [*rows[ordered]] == [earlier, row]
+    assert [*rows[dataclasses.replace(ordered, after=(earlier.created.value,))]] == [
+        row
+    ]
+    assert [
+        *rows[
+            Query(
+                mask=Mask(kind=row.kind, chain=earlier.chain, created=earlier.created),
+                limit=None,
+            )
+        ]
+    ] == [earlier]
+
+    reserver = Item.Reserver()
+    unreserved = Query(mask=Mask(kind=row.kind, reserver=Item.Reserver(None)), limit=1)
+    (reserved,) = rows.reserve(unreserved, reserver)
+    assert reserved.reserver == reserver
+
+    rows[reserved] = dataclasses.replace(reserved, status=Item.Status("other"))
+    assert sorted(r.status.value for r in rows[ordered]) == ["other", "status"]
+
+    assert sorted(d.value for d in rows.delete_where(Mask(kind=row.kind))) == [
+        row.digest.value,
+        row.digest.value,
+    ]
+
+
+def test_write_errors_propagate(rows: Rows.Core, row: Rows.Core.Item):
+    rows.append(row)
+
+    def fail(connection, cursor, statement: str, *args):
+        if statement.lower().startswith(("update", "delete")):
+            raise sqlite3.OperationalError("disk I/O error")
+
+    sqlalchemy.event.listen(rows.db, "before_cursor_execute", fail)
+    try:
+        with pytest.raises(sqlalchemy.exc.OperationalError):
+            rows.update_where(Mask(kind=row.kind), Changes(status=Item.Status("other")))
+        with pytest.raises(sqlalchemy.exc.OperationalError):
+            rows.delete_where(Mask(kind=row.kind))
+        with pytest.raises(sqlalchemy.exc.OperationalError):
+            rows[row] = dataclasses.replace(row, status=Item.Status("other"))
+    finally:
+        sqlalchemy.event.remove(rows.db, "before_cursor_execute", fail)
+
+    assert [r.status for r in rows[Query(mask=Mask(kind=row.kind), limit=None)]] == [
+        row.status
+    ]
+    assert not rows.delete_where(
+        Mask(kind=row.kind, metadata=Item.Metadata({Item.Metadata.Key("absent"): 1}))
+    )
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_paged_order_nulls(rows: Rows.Core, row: Rows.Core.Item, descending: bool):
+    paged = dataclasses.replace(rows, chunk=2)
+    positions = (1, None, None, 2, None, 0)
+    paged.append_many(
+        [
+            dataclasses.replace(
+                row, metadata=Item.Metadata({Item.Metadata.Key("position"): p})
+            )
+            for p in positions
+        ]
+    )
+
+    got = [
+        r.metadata["position"]
+        for r in paged[
+            Query(
+                mask=Mask(kind=row.kind),
+                limit=None,
+                order=Query.Order(("position",), descending=descending),
+            )
+        ]
+    ]
+    expected = [None, None, None, 0, 1, 2]
+    assert got == (expected[::-1] if descending else expected)
+
+
+def test_plain_select_elsewhere(
+    rows: Rows.Core, row: Rows.Core.Item, monkeypatch: pytest.MonkeyPatch
+):
+    rows.append_many([row, dataclasses.replace(row, chain="other")])
+    monkeypatch.setattr(rows.db.dialect, "name", "other")
+    monkeypatch.setattr(rows.db.dialect, "supports_server_side_cursors", False)
+
+    assert len([*rows[Query(mask=Mask(kind=row.kind), limit=None)]]) == 2
@@ -0,0 +1,57 @@
+import pytest
+
+from conveyor.core import Verification
+from conveyor.core.Item import Data, Digest
+
+
+@pytest.fixture
+def data() -> Data:
+    return Data(value=b"v")
+
+
+@pytest.fixture
+def wrong() -> Digest:
+    return Digest(b" " * 64)
+
+
+def test_always(data: Data, wrong: Digest):
+    v = Verification.Always()
+    for _ in range(2):
+        assert v(data.value, data.digest) == data
+    with pytest.raises(ValueError):
+        v(data.value, wrong)
+    assert v.statistics == Verification.Statistics(
+        verified=2, verified_bytes=2, failures=1
+    )
+
+
+def test_once(data: Data, wrong: Digest):
+    v = Verification.Once()
+    for _ in range(3):
+        assert v(data.value, data.digest) == data
+    with pytest.raises(ValueError):
+        v(data.value, wrong)
+    with pytest.raises(ValueError):
+        v(data.value, wrong)
+    assert v.statistics == Verification.Statistics(
+        verified=1, verified_bytes=1, skipped=2, failures=2
+    )
+
+
+def test_sampled(data: Data):
+    v = Verification.Sampled(n=3)
+    for _ in range(6):
+        v(data.value, data.digest)
+    assert v.statistics.verified == 2
+    assert v.statistics.skipped == 4
+
+
+def test_sampled_invalid_n():
+    with pytest.raises(ValueError):
+        Verification.Sampled(n=0)
+
+
+def test_never(data: Data, wrong: Digest):
+    v = Verification.Never()
+    assert v(data.value, wrong).digest == wrong
+    assert v.statistics == Verification.Statistics(skipped=1)
@@ -0,0 +1,27 @@
+import copy
+import pytest
+
+from conveyor.core import Item
+
+from ..common import *
+
+
+def test_invalid_value():
+    with pytest.raises(TypeError):
+        Item.Status("not a word")
+
+
+def test_interned():
+    assert Item.Status("word") is Item.Status("word")
+    assert Item.Status("word") is Item.Status(value="word")
+    assert copy.deepcopy(Item.Status("word")) is Item.Status("word")
+
+
+def test_interned_per_type():
+    assert Item.Kind("word") is not Item.Status("word")
+    assert Item.Kind("word") != Item.Status("word")
+
+
+def test_slotted(item: Item):
+    for o in (item, item.kind, item.chain, item.created, item.metadata):
+        assert not hasattr(o, "__dict__")